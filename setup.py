@@ -0,0 +1,24 @@
+"""
+Optional compiled-extension build.
+
+Project metadata lives in pyproject.toml. This file only adds the Cython
+forcing kernel (src/_forcing_c.pyx) when Cython is importable at build time,
+for example ``pip install cython && pip install -e . --no-build-isolation``.
+Otherwise the package builds as pure Python and uses the Numba/Python kernel.
+"""
+
+from setuptools import setup
+
+try:
+    from Cython.Build import cythonize
+except ImportError:
+    ext_modules = []
+else:
+    from setuptools import Extension
+
+    ext_modules = cythonize(
+        [Extension("src._forcing_c", ["src/_forcing_c.pyx"], optional=True)],
+        language_level=3,
+    )
+
+setup(ext_modules=ext_modules)
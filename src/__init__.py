@@ -12,37 +12,103 @@ __version__ = "0.1.0"
 __author__ = "Nurudeen Abdulsalaam"
 __license__ = "MIT"
 
-# Import core modules
-from . import albedo, forcing, model, validation
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from . import albedo, forcing, model, validation
+    from .albedo import (
+        SURFACE_LIBRARY,
+        SurfaceAlbedo,
+        base_albedo,
+        base_albedo_many,
+        list_surface_types,
+        perturbed_albedo,
+        perturbed_albedo_batch,
+        validate_albedo,
+    )
+    from .forcing import (
+        GEOMETRIC_FACTOR,
+        SOLAR_CONSTANT_W_M2,
+        ForcingResult,
+        ForcingResultBatch,
+        albedo_difference,
+        delta_radiative_forcing,
+        delta_radiative_forcing_batch,
+        make_forcing_fn,
+        validate_delta_albedo,
+    )
+    from .model import (
+        PipelineResult,
+        Scenario,
+        albedo_pipeline,
+        forcing_sweep,
+    )
+    from .validation import (
+        BENCHMARK_SENSITIVITY_W_M2_PER_DELTA_ALPHA,
+        ValidationResult,
+        expected_forcing_range,
+        validate_area_fraction,
+        validate_forcing_result,
+        validate_forcing_result_batch,
+    )
+
+# Submodules and re-exported names are resolved on first access (PEP 562), so
+# ``import src`` stays cheap and NumPy/Numba load only when a symbol needs them.
+_SUBMODULES = ("albedo", "forcing", "model", "validation")
+_EXPORTS: dict[str, tuple[str, ...]] = {
+    "albedo": (
+        "SURFACE_LIBRARY",
+        "SurfaceAlbedo",
+        "base_albedo",
+        "base_albedo_many",
+        "list_surface_types",
+        "perturbed_albedo",
+        "perturbed_albedo_batch",
+        "validate_albedo",
+    ),
+    "forcing": (
+        "GEOMETRIC_FACTOR",
+        "SOLAR_CONSTANT_W_M2",
+        "ForcingResult",
+        "ForcingResultBatch",
+        "albedo_difference",
+        "delta_radiative_forcing",
+        "delta_radiative_forcing_batch",
+        "make_forcing_fn",
+        "validate_delta_albedo",
+    ),
+    "model": (
+        "PipelineResult",
+        "Scenario",
+        "albedo_pipeline",
+        "forcing_sweep",
+    ),
+    "validation": (
+        "BENCHMARK_SENSITIVITY_W_M2_PER_DELTA_ALPHA",
+        "ValidationResult",
+        "expected_forcing_range",
+        "validate_area_fraction",
+        "validate_forcing_result",
+        "validate_forcing_result_batch",
+    ),
+}
+_LAZY: dict[str, str] = {name: module for module, names in _EXPORTS.items() for name in names}
+
+
+def __getattr__(name: str) -> Any:
+    if name in _SUBMODULES:
+        return importlib.import_module(f".{name}", __name__)
+    if name not in _LAZY:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{_LAZY[name]}", __name__), name)
+    globals()[name] = value  # Cache so later lookups bypass __getattr__.
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
 
-# Expose key classes and functions at package level
-from .albedo import (
-    SURFACE_LIBRARY,
-    SurfaceAlbedo,
-    base_albedo,
-    list_surface_types,
-    perturbed_albedo,
-    validate_albedo,
-)
-from .forcing import (
-    GEOMETRIC_FACTOR,
-    SOLAR_CONSTANT_W_M2,
-    ForcingResult,
-    albedo_difference,
-    delta_radiative_forcing,
-    validate_delta_albedo,
-)
-from .model import (
-    Scenario,
-    albedo_pipeline,
-)
-from .validation import (
-    BENCHMARK_SENSITIVITY_W_M2_PER_DELTA_ALPHA,
-    ValidationResult,
-    expected_forcing_range,
-    validate_area_fraction,
-    validate_forcing_result,
-)
 
 __all__ = [
     # Version info
@@ -60,21 +126,29 @@ __all__ = [
     "validate_albedo",
     "list_surface_types",
     "base_albedo",
+    "base_albedo_many",
     "perturbed_albedo",
+    "perturbed_albedo_batch",
     # Forcing module
     "SOLAR_CONSTANT_W_M2",
     "GEOMETRIC_FACTOR",
     "ForcingResult",
+    "ForcingResultBatch",
     "validate_delta_albedo",
     "delta_radiative_forcing",
+    "delta_radiative_forcing_batch",
+    "make_forcing_fn",
     "albedo_difference",
     # Model module
+    "PipelineResult",
     "Scenario",
     "albedo_pipeline",
+    "forcing_sweep",
     # Validation module
     "BENCHMARK_SENSITIVITY_W_M2_PER_DELTA_ALPHA",
     "ValidationResult",
     "validate_area_fraction",
     "expected_forcing_range",
     "validate_forcing_result",
+    "validate_forcing_result_batch",
 ]
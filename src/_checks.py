@@ -0,0 +1,38 @@
+"""
+Shared range checks for validators and vectorized paths.
+
+Scalar hot paths keep their inline chained comparison (``lo <= x <= hi``) and
+only call into this module to build the exception, so the common, valid case
+pays no extra function call. Array paths call :func:`check_array_range`.
+"""
+
+import numpy as np
+import numpy.typing as npt
+
+
+def range_error(name: str, low: float, high: float) -> ValueError:
+    """Build the canonical out-of-range error, e.g. 'albedo must be between 0 and 1.'"""
+    return ValueError(f"{name} must be between {low:g} and {high:g}.")
+
+
+def check_array_range(name: str, values: npt.NDArray[np.float64], low: float, high: float) -> None:
+    """Raise :func:`range_error` if any element of `values` is NaN or lies outside [low, high]."""
+    # Two reductions instead of two boolean masks: no temporaries. NaN propagates through
+    # min/max and fails the positive comparison, so it is rejected, as the scalar
+    # ``not lo <= x <= hi`` checks reject it. Empty arrays are trivially in range.
+    if values.size and not (low <= values.min() and values.max() <= high):
+        raise range_error(name, low, high)
+
+
+def nan_error(name: str) -> ValueError:
+    """Build the canonical NaN error for unbounded inputs, e.g. 'delta must not be NaN.'"""
+    return ValueError(f"{name} must not be NaN.")
+
+
+def check_array_not_nan(name: str, values: npt.NDArray[np.float64]) -> None:
+    """Raise :func:`nan_error` if any element of `values` is NaN."""
+    if np.isnan(values).any():
+        raise nan_error(name)
+
+
+__all__ = ["range_error", "check_array_range", "nan_error", "check_array_not_nan"]
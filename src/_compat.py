@@ -0,0 +1,33 @@
+"""
+Optional-dependency and Python-version shims.
+
+Numba is an optional accelerator (``pip install albedo-radiative-forcing[jit]``).
+Nothing here imports it: :data:`NUMBA_AVAILABLE` only looks the package up, and
+:func:`njit` imports Numba the first time it is applied. Without Numba, ``njit``
+returns the decorated function unchanged, so kernels run as plain Python with
+identical semantics.
+"""
+
+import importlib.util
+import sys
+from typing import Any, Callable, TypeVar
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+# ``dataclass(slots=True)`` needs Python 3.10+; on 3.9 instances keep a ``__dict__``.
+DATACLASS_SLOTS: dict[str, bool] = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+# Importing Numba costs ~300 ms, so look it up without loading it.
+NUMBA_AVAILABLE = importlib.util.find_spec("numba") is not None
+
+
+def njit(**options: Any) -> Callable[[F], F]:
+    """Compile with ``numba.njit(**options)`` when available, else leave the function as-is."""
+    if not NUMBA_AVAILABLE:  # pragma: no cover - exercised only without numba
+        return lambda func: func
+    import numba
+
+    return numba.njit(**options)  # type: ignore[no-any-return]
+
+
+__all__ = ["DATACLASS_SLOTS", "NUMBA_AVAILABLE", "njit"]
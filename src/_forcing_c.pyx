@@ -0,0 +1,23 @@
+# cython: language_level=3, boundscheck=False, wraparound=False
+"""
+Optional compiled forcing kernel.
+
+Mirrors ``forcing._forcing_kernel``: fused bound checks plus the forcing
+product, returning NaN when any input is out of range. Built only when Cython
+is available at install time (see setup.py); otherwise the Numba/Python
+kernel in forcing.py is used.
+"""
+
+from libc.math cimport NAN
+
+
+cpdef double forcing_kernel(
+    double initial,
+    double final,
+    double area,
+    double solar_constant,
+    double geometric_factor,
+) noexcept nogil:
+    if not (0.0 <= initial <= 1.0 and 0.0 <= final <= 1.0 and 0.0 <= area <= 1.0):
+        return NAN
+    return -solar_constant * geometric_factor * (final - initial) * area
@@ -0,0 +1,31 @@
+"""
+Numba-compiled kernels.
+
+Imported on first use (see :func:`model.forcing_sweep`) rather than at package
+import, so only callers that actually run a compiled kernel pay for loading Numba.
+"""
+
+import numpy as np
+import numpy.typing as npt
+from numba import prange
+
+from . import forcing
+from ._compat import njit
+
+_drf_core = njit(cache=True)(forcing._drf_core)
+
+
+@njit(parallel=True, cache=True)
+def sweep_kernel(
+    bases: npt.NDArray[np.float64],
+    deltas: npt.NDArray[np.float64],
+    areas: npt.NDArray[np.float64],
+    solar_constant: float,
+    geometric_factor: float,
+) -> npt.NDArray[np.float64]:
+    """Parallel loop behind :func:`model.forcing_sweep`; inputs are flat and pre-validated."""
+    out = np.empty(bases.size)
+    for i in prange(bases.size):
+        final = min(1.0, max(0.0, bases[i] + deltas[i]))
+        out[i] = _drf_core(final - bases[i], areas[i], solar_constant, geometric_factor)
+    return out
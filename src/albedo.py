@@ -4,16 +4,28 @@ Surface albedo parameterization for common land-cover types.
 Albedo values represent broadband shortwave reflectance under clear-sky
 conditions and are intended for quick energy-balance experiments. Values
 are drawn from literature ranges; see inline comments for sources.
+
+``SURFACE_LIBRARY`` is a read-only mapping: lookups are served from tables
+built from it at import time, so it cannot be extended or edited in place.
 """
 
-from collections.abc import Iterable
+import functools
+import math
+from collections.abc import Iterable, Mapping
 from dataclasses import dataclass
-from typing import Literal
+from types import MappingProxyType
+from typing import Literal, NoReturn
+
+import numpy as np
+import numpy.typing as npt
+
+from ._checks import check_array_not_nan, nan_error, range_error
+from ._compat import DATACLASS_SLOTS
 
 Anchor = Literal["typical", "min", "max"]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class SurfaceAlbedo:
     """Typical albedo characteristics for a land-surface class."""
 
@@ -30,36 +42,77 @@ class SurfaceAlbedo:
 # - Snow, aging/dusty: 0.40-0.60, mid ~0.50 (Wiscombe & Warren, 1980).
 # - Urban/built: 0.12-0.20, mid ~0.16 (Taha, 1997; Oke, 1987).
 # - Cropland/bare soil: 0.15-0.25, mid ~0.20 (Sellers, 1965).
-SURFACE_LIBRARY: dict[str, SurfaceAlbedo] = {
-    "vegetation": SurfaceAlbedo(typical=0.17, range_min=0.13, range_max=0.20, note="closed canopy forest/grass"),
-    "desert": SurfaceAlbedo(typical=0.38, range_min=0.30, range_max=0.45, note="bright sand"),
-    "snow_fresh": SurfaceAlbedo(typical=0.78, range_min=0.70, range_max=0.85, note="fresh dry snow"),
-    "snow_aged": SurfaceAlbedo(typical=0.50, range_min=0.40, range_max=0.60, note="aging or dusty snow"),
-    "urban": SurfaceAlbedo(typical=0.16, range_min=0.12, range_max=0.20, note="built environment"),
-    "cropland": SurfaceAlbedo(typical=0.20, range_min=0.15, range_max=0.25, note="bare soil or sparse crop"),
-}
+# Read-only: the lookup tables below are built from this mapping once at import,
+# so in-place edits would otherwise be silently ignored by base_albedo and friends.
+SURFACE_LIBRARY: Mapping[str, SurfaceAlbedo] = MappingProxyType(
+    {
+        "vegetation": SurfaceAlbedo(typical=0.17, range_min=0.13, range_max=0.20, note="closed canopy forest/grass"),
+        "desert": SurfaceAlbedo(typical=0.38, range_min=0.30, range_max=0.45, note="bright sand"),
+        "snow_fresh": SurfaceAlbedo(typical=0.78, range_min=0.70, range_max=0.85, note="fresh dry snow"),
+        "snow_aged": SurfaceAlbedo(typical=0.50, range_min=0.40, range_max=0.60, note="aging or dusty snow"),
+        "urban": SurfaceAlbedo(typical=0.16, range_min=0.12, range_max=0.20, note="built environment"),
+        "cropland": SurfaceAlbedo(typical=0.20, range_min=0.15, range_max=0.25, note="bare soil or sparse crop"),
+    }
+)
+
+
+# Struct-of-arrays view of SURFACE_LIBRARY built once at import: one row per surface,
+# columns ordered (typical, min, max). Lookups become a row/column index instead of
+# an attribute fetch per anchor, and multi-surface queries are a single fancy index.
+_SURFACE_IDX: dict[str, int] = {key.lower(): row for row, key in enumerate(SURFACE_LIBRARY)}
+_SURFACE_TABLE: npt.NDArray[np.float64] = np.array(
+    [[surf.typical, surf.range_min, surf.range_max] for surf in SURFACE_LIBRARY.values()],
+    dtype=np.float64,
+)
+_ANCHOR_COL: dict[str, int] = {"typical": 0, "min": 1, "max": 2}
+_SURFACE_KEYS: tuple[str, ...] = tuple(SURFACE_LIBRARY)
 
 
 def validate_albedo(value: float) -> float:
     """Validate an albedo value is within [0, 1]."""
     if not 0.0 <= value <= 1.0:
-        raise ValueError("albedo must be between 0 and 1.")
+        raise range_error("albedo", 0.0, 1.0)
     return value
 
 
-def list_surface_types() -> Iterable[str]:
-    """Return supported surface keys."""
-    return SURFACE_LIBRARY.keys()
+def list_surface_types() -> tuple[str, ...]:
+    """Return supported surface keys (a tuple cached at import)."""
+    return _SURFACE_KEYS
+
 
+def _anchor_column(anchor: Anchor) -> int:
+    try:
+        return _ANCHOR_COL[anchor]
+    except KeyError:
+        raise ValueError(f"Unsupported anchor '{anchor}'. Choose from 'typical', 'min', or 'max'.") from None
 
-def _anchor_value(surface: SurfaceAlbedo, anchor: Anchor) -> float:
-    if anchor == "typical":
-        return surface.typical
-    if anchor == "min":
-        return surface.range_min
-    if anchor == "max":
-        return surface.range_max
-    raise ValueError(f"Unsupported anchor '{anchor}'. Choose from 'typical', 'min', or 'max'.")
+
+@functools.lru_cache(maxsize=64)
+def _normalize(surface_type: str) -> str:
+    # Sweeps reuse a handful of names; memoize the case folding instead of redoing it per call.
+    return surface_type.lower()
+
+
+def _surface_row(surface_type: str) -> int:
+    key = _normalize(surface_type)
+    if key not in _SURFACE_IDX:
+        raise KeyError(f"Surface type '{surface_type}' not found. Available: {', '.join(_SURFACE_KEYS)}")
+    return _SURFACE_IDX[key]
+
+
+# Scalar lookups resolve to one dict probe on (lower-cased name, anchor). Values are
+# validated once here, so base_albedo has nothing left to re-check per call.
+_BASE_TABLE: dict[tuple[str, str], float] = {
+    (key, anchor): validate_albedo(float(_SURFACE_TABLE[row, column]))
+    for key, row in _SURFACE_IDX.items()
+    for anchor, column in _ANCHOR_COL.items()
+}
+
+
+def _raise_lookup_error(surface_type: str, anchor: Anchor) -> NoReturn:
+    _surface_row(surface_type)  # KeyError for an unknown surface
+    _anchor_column(anchor)  # ValueError for an unknown anchor
+    raise AssertionError(f"({surface_type!r}, {anchor!r}) missing from _BASE_TABLE")
 
 
 def base_albedo(surface_type: str, *, anchor: Anchor = "typical") -> float:
@@ -73,11 +126,32 @@ def base_albedo(surface_type: str, *, anchor: Anchor = "typical") -> float:
     anchor : {'typical', 'min', 'max'}
         Which value to return: the literature mid-point or bounds.
     """
-    key = surface_type.lower()
-    if key not in SURFACE_LIBRARY:
-        raise KeyError(f"Surface type '{surface_type}' not found. Available: {', '.join(SURFACE_LIBRARY)}")
-    value = _anchor_value(SURFACE_LIBRARY[key], anchor)
-    return validate_albedo(value)
+    value = _BASE_TABLE.get((_normalize(surface_type), anchor))
+    if value is None:
+        _raise_lookup_error(surface_type, anchor)
+    return value
+
+
+def base_albedo_many(surface_types: Iterable[str], *, anchor: Anchor = "typical") -> npt.NDArray[np.float64]:
+    """
+    Get unperturbed albedos for several surface types in one lookup.
+
+    Parameters
+    ----------
+    surface_types : iterable of str
+        Keys in SURFACE_LIBRARY (case-insensitive).
+    anchor : {'typical', 'min', 'max'}
+        Which value to return for every surface.
+
+    Returns
+    -------
+    numpy.ndarray
+        Albedos in the order of `surface_types`.
+    """
+    column = _anchor_column(anchor)
+    rows = np.fromiter((_surface_row(surface_type) for surface_type in surface_types), dtype=np.intp)
+    values: npt.NDArray[np.float64] = _SURFACE_TABLE[rows, column]
+    return values
 
 
 def perturbed_albedo(surface_type: str, delta: float, *, anchor: Anchor = "typical") -> float:
@@ -91,14 +165,53 @@ def perturbed_albedo(surface_type: str, delta: float, *, anchor: Anchor = "typic
     surface_type : str
         Name of the surface in SURFACE_LIBRARY.
     delta : float
-        Additive perturbation to the anchor albedo (e.g., -0.02 to darken).
+        Additive perturbation to the anchor albedo (e.g., -0.02 to darken). Must not be NaN.
     anchor : {'typical', 'min', 'max'}
         Baseline albedo used before perturbation.
     """
+    if math.isnan(delta):
+        # NaN would otherwise slip through min/max and come out as 1.0.
+        raise nan_error("delta")
+    base = base_albedo(surface_type, anchor=anchor)
+    # Clip to [0, 1] to avoid unphysical values; the clipped value needs no re-validation.
+    clipped = max(0.0, min(1.0, base + delta))
+    if __debug__:
+        assert 0.0 <= clipped <= 1.0
+    return clipped
+
+
+def perturbed_albedo_batch(
+    surface_type: str,
+    deltas: npt.ArrayLike,
+    *,
+    anchor: Anchor = "typical",
+) -> npt.NDArray[np.float64]:
+    """
+    Vectorized :func:`perturbed_albedo` over an array of perturbations for one surface.
+
+    Parameters
+    ----------
+    surface_type : str
+        Name of the surface in SURFACE_LIBRARY.
+    deltas : array_like
+        Additive perturbations to the anchor albedo. NaN elements reject the batch.
+    anchor : {'typical', 'min', 'max'}
+        Baseline albedo used before perturbation.
+
+    Returns
+    -------
+    numpy.ndarray
+        Perturbed albedos clipped to [0, 1], with the shape of `deltas`.
+        Subtracting the base albedo gives Δα suitable for
+        :func:`forcing.delta_radiative_forcing_batch`.
+    """
     base = base_albedo(surface_type, anchor=anchor)
-    perturbed = base + delta
-    # Clip to [0, 1] to avoid unphysical values.
-    return validate_albedo(max(0.0, min(1.0, perturbed)))
+    # Own float64 copy of the deltas (0-d for scalar input) so both steps run in place;
+    # np.add on a scalar would return a NumPy scalar, which clip cannot write into.
+    perturbed = np.array(deltas, dtype=np.float64)
+    perturbed += base
+    check_array_not_nan("delta", perturbed)
+    return np.clip(perturbed, 0.0, 1.0, out=perturbed)
 
 
 __all__ = [
@@ -107,5 +220,7 @@ __all__ = [
     "validate_albedo",
     "list_surface_types",
     "base_albedo",
+    "base_albedo_many",
     "perturbed_albedo",
+    "perturbed_albedo_batch",
 ]
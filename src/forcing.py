@@ -13,15 +13,23 @@ lets you scale a regional albedo change to a global-mean forcing by assuming
 the perturbation is uniformly distributed over that fraction of the planet.
 """
 
+import math
 from dataclasses import dataclass
-from typing import Optional
+from typing import Protocol
+
+import numpy as np
+import numpy.typing as npt
+
+from ._checks import check_array_range, range_error
+from ._compat import DATACLASS_SLOTS, njit
 
 # Physically meaningful constants
 SOLAR_CONSTANT_W_M2 = 1361.0  # Current best estimate of total solar irradiance (W m^-2)
 GEOMETRIC_FACTOR = 0.25  # Spherical Earth distributes intercepted solar energy over 4x area
+_S0G_DEFAULT = SOLAR_CONSTANT_W_M2 * GEOMETRIC_FACTOR  # Global-mean insolation (~340 W m^-2), folded once
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class ForcingResult:
     """Container for forcing diagnostics."""
 
@@ -29,6 +37,17 @@ class ForcingResult:
     area_fraction: float
     radiative_forcing_w_m2: float
 
+    @classmethod
+    def _fast(cls, delta_albedo: float, area_fraction: float, radiative_forcing_w_m2: float) -> "ForcingResult":
+        # Internal constructor for already-validated values: skips the generated frozen
+        # __init__ (keyword binding plus a field-by-field setattr dispatch), roughly
+        # halving construction cost. The instance is still frozen.
+        obj = object.__new__(cls)
+        object.__setattr__(obj, "delta_albedo", delta_albedo)
+        object.__setattr__(obj, "area_fraction", area_fraction)
+        object.__setattr__(obj, "radiative_forcing_w_m2", radiative_forcing_w_m2)
+        return obj
+
 
 def validate_delta_albedo(delta_albedo: float) -> float:
     """
@@ -37,7 +56,7 @@ def validate_delta_albedo(delta_albedo: float) -> float:
     Values outside this range imply negative or >100% reflectance and are rejected.
     """
     if not -1.0 <= delta_albedo <= 1.0:
-        raise ValueError("delta_albedo must be between -1 and 1.")
+        raise range_error("delta_albedo", -1.0, 1.0)
     return delta_albedo
 
 
@@ -75,19 +94,235 @@ def delta_radiative_forcing(
       of the globe and that atmospheric adjustments are negligible.
     - This is an instantaneous, zero-feedback estimate; cloud responses, spectral effects,
       and latitudinal insolation gradients are not represented.
+
+    Examples
+    --------
+    >>> delta_alpha = albedo_difference(0.30, 0.28)  # 0.02 darkening
+    >>> result = delta_radiative_forcing(delta_alpha, area_fraction=0.5)
+    >>> round(result.radiative_forcing_w_m2, 4)
+    3.4025
     """
     if not 0.0 <= area_fraction <= 1.0:
-        raise ValueError("area_fraction must be between 0 and 1.")
+        raise range_error("area_fraction", 0.0, 1.0)
     validate_delta_albedo(delta_albedo)
 
-    absorbed_solar_change = -solar_constant * geometric_factor * delta_albedo
+    if solar_constant is SOLAR_CONSTANT_W_M2 and geometric_factor is GEOMETRIC_FACTOR:
+        mean_insolation = _S0G_DEFAULT
+    else:
+        mean_insolation = solar_constant * geometric_factor
+    absorbed_solar_change = -mean_insolation * delta_albedo
     radiative_forcing = absorbed_solar_change * area_fraction
 
-    return ForcingResult(
-        delta_albedo=delta_albedo,
-        area_fraction=area_fraction,
-        radiative_forcing_w_m2=radiative_forcing,
-    )
+    return ForcingResult._fast(delta_albedo, area_fraction, radiative_forcing)
+
+
+def delta_radiative_forcing_batch(
+    delta_albedo: npt.ArrayLike,
+    area_fraction: npt.ArrayLike = 1.0,
+    *,
+    solar_constant: float = SOLAR_CONSTANT_W_M2,
+    geometric_factor: float = GEOMETRIC_FACTOR,
+) -> npt.NDArray[np.float64]:
+    """
+    Vectorized counterpart of :func:`delta_radiative_forcing` for many perturbations at once.
+
+    Parameters
+    ----------
+    delta_albedo : array_like
+        Changes in broadband albedo (final - initial), each within [-1, 1].
+    area_fraction : array_like, optional
+        Affected fractions of Earth's surface (0-1). Broadcast against `delta_albedo`.
+    solar_constant : float, optional
+        Total solar irradiance in W m^-2.
+    geometric_factor : float, optional
+        Accounts for spherical geometry (default 0.25 = 1/4).
+
+    Returns
+    -------
+    numpy.ndarray
+        Radiative forcing (W m^-2) with the broadcast shape of the inputs.
+
+    Notes
+    -----
+    Validation is applied to whole arrays, so a single out-of-range element rejects the batch.
+    Use this instead of looping over :func:`delta_radiative_forcing` when only the forcing
+    values are needed; no per-element ``ForcingResult`` is allocated.
+    """
+    delta = np.asarray(delta_albedo, dtype=np.float64)
+    area = np.asarray(area_fraction, dtype=np.float64)
+    check_array_range("delta_albedo", delta, -1.0, 1.0)
+    check_array_range("area_fraction", area, 0.0, 1.0)
+
+    # Same operation order as the scalar path, ((-S0 * g) * Δα) * f_area, so both agree
+    # bit for bit. The expression is a pure product: an FMA would round identically.
+    if solar_constant is SOLAR_CONSTANT_W_M2 and geometric_factor is GEOMETRIC_FACTOR:
+        mean_insolation = _S0G_DEFAULT
+    else:
+        mean_insolation = solar_constant * geometric_factor
+    out = np.empty(np.broadcast(delta, area).shape, dtype=np.float64)
+    np.multiply(delta, -mean_insolation, out=out)
+    np.multiply(out, area, out=out)
+    return out
+
+
+@dataclass(frozen=True, eq=False, **DATACLASS_SLOTS)
+class ForcingResultBatch:
+    """
+    Column-oriented container for many forcing diagnostics (one read-only 1-D array per field).
+
+    Equality and hashing are identity-based: the fields are arrays, so compare columns
+    with :func:`numpy.array_equal` when needed.
+    """
+
+    delta_albedo: npt.NDArray[np.float64]
+    area_fraction: npt.NDArray[np.float64]
+    radiative_forcing_w_m2: npt.NDArray[np.float64]
+
+    @classmethod
+    def compute(
+        cls,
+        delta_albedo: npt.ArrayLike,
+        area_fraction: npt.ArrayLike = 1.0,
+        *,
+        solar_constant: float = SOLAR_CONSTANT_W_M2,
+        geometric_factor: float = GEOMETRIC_FACTOR,
+    ) -> "ForcingResultBatch":
+        """
+        Evaluate :func:`delta_radiative_forcing_batch` and keep the inputs alongside the result.
+
+        `delta_albedo` and `area_fraction` are broadcast to a common 1-D shape (scalars
+        become length-1 columns), so element ``i`` of every column describes the same
+        perturbation. Inputs that broadcast to more than one dimension raise ValueError.
+        """
+        delta, area = np.broadcast_arrays(
+            np.atleast_1d(np.asarray(delta_albedo, dtype=np.float64)),
+            np.atleast_1d(np.asarray(area_fraction, dtype=np.float64)),
+        )
+        if delta.ndim != 1:
+            raise ValueError(f"ForcingResultBatch columns must be 1-D; inputs broadcast to shape {delta.shape}.")
+        # Own, read-only columns: no aliasing of caller arrays or zero-stride broadcast views,
+        # so the frozen container cannot drift out of sync with its forcing column.
+        delta = np.array(delta, dtype=np.float64, copy=True)
+        area = np.array(area, dtype=np.float64, copy=True)
+        forcing = delta_radiative_forcing_batch(
+            delta,
+            area,
+            solar_constant=solar_constant,
+            geometric_factor=geometric_factor,
+        )
+        for column in (delta, area, forcing):
+            column.flags.writeable = False
+        return cls(delta_albedo=delta, area_fraction=area, radiative_forcing_w_m2=forcing)
+
+    def __len__(self) -> int:
+        return len(self.radiative_forcing_w_m2)
+
+    def __getitem__(self, index: int) -> ForcingResult:
+        """Return a single scalar :class:`ForcingResult` for one element of the batch."""
+        return ForcingResult(
+            delta_albedo=float(self.delta_albedo[index]),
+            area_fraction=float(self.area_fraction[index]),
+            radiative_forcing_w_m2=float(self.radiative_forcing_w_m2[index]),
+        )
+
+
+class ForcingFn(Protocol):
+    """Signature of the functions returned by :func:`make_forcing_fn`."""
+
+    def __call__(self, delta_albedo: float, area_fraction: float = ...) -> float: ...
+
+
+def make_forcing_fn(
+    solar_constant: float = SOLAR_CONSTANT_W_M2,
+    geometric_factor: float = GEOMETRIC_FACTOR,
+    *,
+    jit: bool = False,
+) -> ForcingFn:
+    """
+    Build a forcing function with the solar constants folded in, for long sweeps.
+
+    Parameters
+    ----------
+    solar_constant : float, optional
+        Total solar irradiance in W m^-2, fixed for the returned function.
+    geometric_factor : float, optional
+        Geometric factor, fixed for the returned function.
+    jit : bool, optional
+        Compile the returned function with Numba when it is installed.
+
+    Returns
+    -------
+    callable
+        ``f(delta_albedo, area_fraction=1.0) -> float`` returning forcing in W m^-2.
+        Inputs are not validated; check them once up front (e.g. with
+        :func:`delta_radiative_forcing_batch`) if they are not trusted.
+    """
+    scale = -solar_constant * geometric_factor
+
+    def forcing_fn(delta_albedo: float, area_fraction: float = 1.0) -> float:
+        return scale * delta_albedo * area_fraction
+
+    # No on-disk cache: every distinct constant pair would add a cache entry.
+    return njit()(forcing_fn) if jit else forcing_fn
+
+
+def _drf_core(delta_albedo: float, area_fraction: float, solar_constant: float, geometric_factor: float) -> float:
+    """
+    Unchecked forcing product, compiled into the parallel sweep kernel by ``_jit``.
+
+    Kept as plain Python here so that importing this module never loads Numba.
+    """
+    return -solar_constant * geometric_factor * delta_albedo * area_fraction
+
+
+def _forcing_kernel_py(
+    initial: float,
+    final: float,
+    area: float,
+    solar_constant: float,
+    geometric_factor: float,
+) -> float:
+    """
+    Fused bound checks and forcing arithmetic for one initial/final albedo pair.
+
+    Returns NaN instead of raising when any input is out of range, matching the
+    Cython build in ``_forcing_c.pyx``.
+    """
+    if not (0.0 <= initial <= 1.0 and 0.0 <= final <= 1.0 and 0.0 <= area <= 1.0):
+        return math.nan
+    return -solar_constant * geometric_factor * (final - initial) * area
+
+
+try:
+    # Cython build of the same kernel (src/_forcing_c.pyx), present only if compiled at install.
+    from ._forcing_c import forcing_kernel as _forcing_kernel
+except ImportError:
+    _forcing_kernel = _forcing_kernel_py
+
+
+def _compute_forcing_fused(
+    initial_albedo: float,
+    final_albedo: float,
+    area_fraction: float,
+    solar_constant: float = SOLAR_CONSTANT_W_M2,
+    geometric_factor: float = GEOMETRIC_FACTOR,
+) -> ForcingResult:
+    """
+    Validate each input exactly once and compute forcing for an albedo change.
+
+    Equivalent to ``delta_radiative_forcing(albedo_difference(initial, final), ...)``
+    without re-checking values between the steps.
+    """
+    radiative_forcing = _forcing_kernel(initial_albedo, final_albedo, area_fraction, solar_constant, geometric_factor)
+    if math.isnan(radiative_forcing):
+        # The kernel only signals; name the offending input here.
+        if not 0.0 <= initial_albedo <= 1.0:
+            raise range_error("initial_albedo", 0.0, 1.0)
+        if not 0.0 <= final_albedo <= 1.0:
+            raise range_error("final_albedo", 0.0, 1.0)
+        if not 0.0 <= area_fraction <= 1.0:
+            raise range_error("area_fraction", 0.0, 1.0)
+    return ForcingResult._fast(final_albedo - initial_albedo, area_fraction, radiative_forcing)
 
 
 def albedo_difference(initial_albedo: float, final_albedo: float) -> float:
@@ -107,32 +342,26 @@ def albedo_difference(initial_albedo: float, final_albedo: float) -> float:
         Δα = final - initial
     """
     if not 0.0 <= initial_albedo <= 1.0:
-        raise ValueError("initial_albedo must be between 0 and 1.")
+        raise range_error("initial_albedo", 0.0, 1.0)
     if not 0.0 <= final_albedo <= 1.0:
-        raise ValueError("final_albedo must be between 0 and 1.")
+        raise range_error("final_albedo", 0.0, 1.0)
 
     return final_albedo - initial_albedo
 
 
-def example_usage() -> Optional[ForcingResult]:
-    """
-    Simple, non-executed example to illustrate the API.
-
-    Example
-    -------
-    >>> delta_alpha = albedo_difference(0.30, 0.28)  # 0.02 darkening
-    >>> result = delta_radiative_forcing(delta_alpha, area_fraction=0.5)
-    >>> result.radiative_forcing_w_m2
-    3.4025
-    """
-    return None
+def _albedo_difference_unchecked(initial_albedo: float, final_albedo: float) -> float:
+    """Δα = final - initial for values the caller has already validated."""
+    return final_albedo - initial_albedo
 
 
 __all__ = [
     "SOLAR_CONSTANT_W_M2",
     "GEOMETRIC_FACTOR",
     "ForcingResult",
+    "ForcingResultBatch",
     "validate_delta_albedo",
     "delta_radiative_forcing",
+    "delta_radiative_forcing_batch",
+    "make_forcing_fn",
     "albedo_difference",
 ]
@@ -10,8 +10,14 @@ and f_area scales a regional perturbation to the global mean.
 """
 
 from dataclasses import dataclass
+from typing import NamedTuple
+
+import numpy as np
+import numpy.typing as npt
 
 from . import albedo, forcing
+from ._checks import check_array_not_nan, check_array_range
+from ._compat import NUMBA_AVAILABLE
 
 
 @dataclass
@@ -40,10 +46,14 @@ class Scenario:
         Positive forcing is downward (warming). A brighter surface (higher albedo)
         yields negative forcing because more solar radiation is reflected.
         """
-        initial = albedo.validate_albedo(self.initial_albedo)
-        final = albedo.validate_albedo(self.final_albedo)
-        delta_alpha = forcing.albedo_difference(initial, final)
-        return forcing.delta_radiative_forcing(delta_alpha, area_fraction=self.area_fraction)
+        return forcing._compute_forcing_fused(self.initial_albedo, self.final_albedo, self.area_fraction)
+
+
+class PipelineResult(NamedTuple):
+    """Scenario and forcing returned by :func:`albedo_pipeline`; unpacks like a 2-tuple."""
+
+    scenario: Scenario
+    forcing: forcing.ForcingResult
 
 
 def albedo_pipeline(
@@ -52,7 +62,7 @@ def albedo_pipeline(
     *,
     anchor: albedo.Anchor = "typical",
     area_fraction: float = 1.0,
-) -> tuple[Scenario, forcing.ForcingResult]:
+) -> PipelineResult:
     """
     End-to-end helper: choose a surface class, perturb its albedo, and compute forcing.
 
@@ -69,15 +79,91 @@ def albedo_pipeline(
 
     Returns
     -------
-    scenario : Scenario
-        Encodes the initial/final albedo and area fraction.
-    forcing_result : ForcingResult
-        Radiative forcing diagnostic (W m^-2).
+    PipelineResult
+        Named pair of:
+
+        scenario : Scenario
+            Encodes the initial/final albedo and area fraction.
+        forcing : ForcingResult
+            Radiative forcing diagnostic (W m^-2).
     """
     base = albedo.base_albedo(surface_type, anchor=anchor)
     perturbed = albedo.perturbed_albedo(surface_type, albedo_delta, anchor=anchor)
     scenario = Scenario(initial_albedo=base, final_albedo=perturbed, area_fraction=area_fraction)
-    return scenario, scenario.forcing()
+    # Both albedos were validated by the albedo module; only Δα and the area remain to check.
+    delta_alpha = forcing._albedo_difference_unchecked(base, perturbed)
+    return PipelineResult(scenario, forcing.delta_radiative_forcing(delta_alpha, area_fraction=area_fraction))
+
+
+def _sweep_kernel_numpy(
+    bases: npt.NDArray[np.float64],
+    deltas: npt.NDArray[np.float64],
+    areas: npt.NDArray[np.float64],
+    solar_constant: float,
+    geometric_factor: float,
+) -> npt.NDArray[np.float64]:
+    # Same arithmetic as the compiled loop in ``_jit``, as whole-array NumPy operations.
+    final = np.clip(bases + deltas, 0.0, 1.0)
+    out: npt.NDArray[np.float64] = -solar_constant * geometric_factor * (final - bases) * areas
+    return out
+
+
+def forcing_sweep(
+    base_albedos: npt.ArrayLike,
+    albedo_deltas: npt.ArrayLike,
+    area_fractions: npt.ArrayLike = 1.0,
+    *,
+    solar_constant: float = forcing.SOLAR_CONSTANT_W_M2,
+    geometric_factor: float = forcing.GEOMETRIC_FACTOR,
+) -> npt.NDArray[np.float64]:
+    """
+    Forcing for many (baseline, perturbation, area) scenarios in one call.
 
+    Each scenario follows :func:`albedo_pipeline`: the perturbed albedo is
+    ``clip(base + delta, 0, 1)`` and the forcing uses Δα = perturbed - base.
+    With Numba installed the loop is compiled and spread across cores;
+    otherwise it runs as vectorized NumPy.
 
-__all__ = ["Scenario", "albedo_pipeline"]
+    Parameters
+    ----------
+    base_albedos : array_like
+        Unperturbed albedos (0-1), e.g. from :func:`albedo.base_albedo_many`.
+    albedo_deltas : array_like
+        Additive perturbations to the baseline albedos.
+    area_fractions : array_like, optional
+        Fraction of Earth's surface affected (0-1).
+    solar_constant : float, optional
+        Total solar irradiance in W m^-2.
+    geometric_factor : float, optional
+        Accounts for spherical geometry (default 0.25 = 1/4).
+
+    Returns
+    -------
+    numpy.ndarray
+        Radiative forcing (W m^-2) with the broadcast shape of the inputs.
+    """
+    bases, deltas, areas = np.broadcast_arrays(
+        np.asarray(base_albedos, dtype=np.float64),
+        np.asarray(albedo_deltas, dtype=np.float64),
+        np.asarray(area_fractions, dtype=np.float64),
+    )
+    check_array_range("albedo", bases, 0.0, 1.0)
+    check_array_not_nan("delta", deltas)
+    check_array_range("area_fraction", areas, 0.0, 1.0)
+    if NUMBA_AVAILABLE:
+        # Deferred so that importing the package never loads Numba.
+        from ._jit import sweep_kernel
+    else:  # pragma: no cover - exercised only without numba
+        sweep_kernel = _sweep_kernel_numpy
+    shape = bases.shape
+    out = sweep_kernel(
+        np.ascontiguousarray(bases).ravel(),
+        np.ascontiguousarray(deltas).ravel(),
+        np.ascontiguousarray(areas).ravel(),
+        solar_constant,
+        geometric_factor,
+    )
+    return out.reshape(shape)
+
+
+__all__ = ["PipelineResult", "Scenario", "albedo_pipeline", "forcing_sweep"]
@@ -17,16 +17,23 @@ documents key uncertainty sources, not as a formal skill score but as a
 sanity check against first-order energy balance expectations.
 """
 
+from collections.abc import Sequence
 from dataclasses import dataclass
+from typing import Any, Union, overload
+
+import numpy as np
+import numpy.typing as npt
 
 from . import forcing as forcing_mod
+from ._checks import check_array_range, range_error
+from ._compat import DATACLASS_SLOTS
 
 # Benchmark sensitivity from zero-dimensional energy balance (IPCC AR5 Ch8 uses
 # similar S0/4 scaling). Per-unit albedo change => -340 W m^-2; per 0.01 => -3.4.
 BENCHMARK_SENSITIVITY_W_M2_PER_DELTA_ALPHA = -340.0
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class ValidationResult:
     """Outcome of forcing validation."""
 
@@ -39,33 +46,72 @@ class ValidationResult:
 def validate_area_fraction(value: float) -> float:
     """Ensure area fraction is within [0, 1]."""
     if not 0.0 <= value <= 1.0:
-        raise ValueError("area_fraction must be between 0 and 1.")
+        raise range_error("area_fraction", 0.0, 1.0)
     return value
 
 
+@overload
+def expected_forcing_range(
+    delta_albedo: float,
+    area_fraction: float = ...,
+    *,
+    tolerance_fraction: float = ...,
+) -> tuple[float, float]: ...
+
+
+@overload
 def expected_forcing_range(
     delta_albedo: float,
-    area_fraction: float = 1.0,
+    area_fraction: Union[npt.NDArray[Any], Sequence[float]],
+    *,
+    tolerance_fraction: float = ...,
+) -> tuple[npt.NDArray[np.float64], npt.NDArray[np.float64]]: ...
+
+
+@overload
+def expected_forcing_range(
+    delta_albedo: Union[npt.NDArray[Any], Sequence[float]],
+    area_fraction: npt.ArrayLike = ...,
+    *,
+    tolerance_fraction: float = ...,
+) -> tuple[npt.NDArray[np.float64], npt.NDArray[np.float64]]: ...
+
+
+def expected_forcing_range(
+    delta_albedo: Any,
+    area_fraction: Any = 1.0,
     *,
     tolerance_fraction: float = 0.2,
-) -> tuple[float, float]:
+) -> Any:
     """
     Compute an expected forcing interval based on IPCC-style shortwave sensitivity.
 
     Parameters
     ----------
-    delta_albedo : float
+    delta_albedo : float or array_like
         Change in broadband albedo (positive = brighter).
-    area_fraction : float
-        Fraction of Earth's surface affected (0-1).
+    area_fraction : float or array_like
+        Fraction of Earth's surface affected (0-1). Broadcast against `delta_albedo`.
     tolerance_fraction : float
         Symmetric fractional tolerance around the benchmark (default ±20%).
 
     Returns
     -------
-    (low, high) : tuple of float
-        Expected forcing bounds (W m^-2).
+    (low, high) : tuple of float or tuple of numpy.ndarray
+        Expected forcing bounds (W m^-2); arrays when either input is array-like.
+
+    Notes
+    -----
+    For large grids of scenarios, pass arrays: the bounds are evaluated elementwise in one call.
     """
+    if not (isinstance(delta_albedo, (int, float)) and isinstance(area_fraction, (int, float))):
+        delta = np.asarray(delta_albedo, dtype=np.float64)
+        area = np.asarray(area_fraction, dtype=np.float64)
+        check_array_range("area_fraction", area, 0.0, 1.0)
+        benchmarks = BENCHMARK_SENSITIVITY_W_M2_PER_DELTA_ALPHA * delta * area
+        spreads = np.abs(benchmarks) * tolerance_fraction
+        return benchmarks - spreads, benchmarks + spreads
+
     validate_area_fraction(area_fraction)
     benchmark = BENCHMARK_SENSITIVITY_W_M2_PER_DELTA_ALPHA * delta_albedo * area_fraction
     spread = abs(benchmark) * tolerance_fraction
@@ -106,10 +152,43 @@ def validate_forcing_result(
     )
 
 
+def validate_forcing_result_batch(
+    delta_albedo: npt.ArrayLike,
+    area_fraction: npt.ArrayLike,
+    modeled_w_m2: npt.ArrayLike,
+    *,
+    tolerance_fraction: float = 0.2,
+) -> npt.NDArray[np.bool_]:
+    """
+    Vectorized :func:`validate_forcing_result` returning only the pass/fail mask.
+
+    Parameters
+    ----------
+    delta_albedo : array_like
+        Change in broadband albedo for each modeled value.
+    area_fraction : array_like
+        Fraction of Earth's surface affected (0-1), broadcast against the other inputs.
+    modeled_w_m2 : array_like
+        Modeled forcing values to check (W m^-2).
+    tolerance_fraction : float
+        Symmetric fractional tolerance around the benchmark (default ±20%).
+
+    Returns
+    -------
+    numpy.ndarray of bool
+        True where the modeled value lies within the expected range.
+    """
+    low, high = expected_forcing_range(np.asarray(delta_albedo), area_fraction, tolerance_fraction=tolerance_fraction)
+    modeled = np.asarray(modeled_w_m2, dtype=np.float64)
+    within: npt.NDArray[np.bool_] = (low <= modeled) & (modeled <= high)
+    return within
+
+
 __all__ = [
     "BENCHMARK_SENSITIVITY_W_M2_PER_DELTA_ALPHA",
     "ValidationResult",
     "validate_area_fraction",
     "expected_forcing_range",
     "validate_forcing_result",
+    "validate_forcing_result_batch",
 ]
@@ -0,0 +1,16 @@
+"""Shared fixtures for the test suite"""
+
+import numpy as np
+import pytest
+
+
+@pytest.fixture
+def delta_batch() -> np.ndarray:
+    """Valid Δα values spanning the full [-1, 1] range, including both bounds"""
+    return np.array([0.0, -0.5, 0.5, -1.0, 1.0])
+
+
+@pytest.fixture
+def albedo_pairs() -> np.ndarray:
+    """(initial, final) albedo pairs: brightening, darkening, and both extremes"""
+    return np.array([[0.3, 0.4], [0.4, 0.3], [1.0, 0.0], [0.0, 1.0]])
@@ -9,16 +9,25 @@ Tests surface albedo parameterization including:
 """
 
 import dataclasses
+import re
+import sys
 
+import numpy as np
 import pytest
 
 from src.albedo import (
     SURFACE_LIBRARY,
     base_albedo,
+    base_albedo_many,
     list_surface_types,
     perturbed_albedo,
+    perturbed_albedo_batch,
     validate_albedo,
 )
+from src.forcing import delta_radiative_forcing, delta_radiative_forcing_batch
+
+# Shared error-message patterns, compiled once per module
+_RE_01 = re.compile("between 0 and 1")
 
 
 class TestSurfaceAlbedo:
@@ -30,6 +39,11 @@ class TestSurfaceAlbedo:
         with pytest.raises(dataclasses.FrozenInstanceError):
             surf.typical = 0.5  # type: ignore
 
+    @pytest.mark.skipif(sys.version_info < (3, 10), reason="dataclass slots require Python 3.10+")
+    def test_surface_albedo_slotted(self) -> None:
+        """Test that SurfaceAlbedo instances carry no per-instance __dict__"""
+        assert not hasattr(SURFACE_LIBRARY["vegetation"], "__dict__")
+
 
 class TestSurfaceLibrary:
     """Tests for SURFACE_LIBRARY"""
@@ -61,6 +75,11 @@ class TestSurfaceLibrary:
         # Desert should be moderately bright
         assert 0.3 <= SURFACE_LIBRARY["desert"].typical <= 0.5
 
+    def test_library_is_read_only(self) -> None:
+        """Test that the library cannot be edited out of sync with the lookup tables"""
+        with pytest.raises(TypeError):
+            SURFACE_LIBRARY["vegetation"] = SURFACE_LIBRARY["desert"]  # type: ignore[index]
+
 
 class TestValidateAlbedo:
     """Tests for validate_albedo function"""
@@ -73,12 +92,12 @@ class TestValidateAlbedo:
 
     def test_invalid_albedos_negative(self) -> None:
         """Test that negative albedos raise ValueError"""
-        with pytest.raises(ValueError, match="between 0 and 1"):
+        with pytest.raises(ValueError, match=_RE_01):
             validate_albedo(-0.1)
 
     def test_invalid_albedos_too_large(self) -> None:
         """Test that albedos > 1 raise ValueError"""
-        with pytest.raises(ValueError, match="between 0 and 1"):
+        with pytest.raises(ValueError, match=_RE_01):
             validate_albedo(1.1)
 
 
@@ -97,6 +116,13 @@ class TestListSurfaceTypes:
         assert "desert" in surfaces
         assert "urban" in surfaces
 
+    def test_returns_cached_tuple(self) -> None:
+        """Test that the same immutable tuple is returned on every call"""
+        surfaces = list_surface_types()
+        assert isinstance(surfaces, tuple)
+        assert surfaces is list_surface_types()
+        assert surfaces == tuple(SURFACE_LIBRARY)
+
 
 class TestBaseAlbedo:
     """Tests for base_albedo function"""
@@ -134,6 +160,41 @@ class TestBaseAlbedo:
             base_albedo("vegetation", anchor="median")  # type: ignore
 
 
+class TestBaseAlbedoMany:
+    """Tests for base_albedo_many function"""
+
+    def test_matches_scalar_lookup(self) -> None:
+        """Test that batch lookup agrees with base_albedo for every anchor"""
+        surfaces = list(list_surface_types())
+        for anchor in ("typical", "min", "max"):
+            values = base_albedo_many(surfaces, anchor=anchor)
+            expected = [base_albedo(surface, anchor=anchor) for surface in surfaces]
+            np.testing.assert_array_equal(values, expected)
+
+    def test_preserves_order_and_case_insensitive(self) -> None:
+        """Test that results follow input order and ignore case"""
+        values = base_albedo_many(["Desert", "VEGETATION", "desert"])
+        assert values.tolist() == [
+            SURFACE_LIBRARY["desert"].typical,
+            SURFACE_LIBRARY["vegetation"].typical,
+            SURFACE_LIBRARY["desert"].typical,
+        ]
+
+    def test_empty_input(self) -> None:
+        """Test that an empty query returns an empty array"""
+        assert base_albedo_many([]).shape == (0,)
+
+    def test_invalid_surface_type(self) -> None:
+        """Test that an unknown surface raises KeyError"""
+        with pytest.raises(KeyError, match="not found"):
+            base_albedo_many(["vegetation", "nonexistent_surface"])
+
+    def test_invalid_anchor(self) -> None:
+        """Test that invalid anchor raises ValueError"""
+        with pytest.raises(ValueError, match="Unsupported anchor"):
+            base_albedo_many(["vegetation"], anchor="median")  # type: ignore
+
+
 class TestPerturbedAlbedo:
     """Tests for perturbed_albedo function"""
 
@@ -183,3 +244,56 @@ class TestPerturbedAlbedo:
             for delta in [-0.5, -0.1, 0.0, 0.1, 0.5]:
                 result = perturbed_albedo(surface, delta)
                 assert 0.0 <= result <= 1.0, f"Result {result} out of bounds for {surface} with delta={delta}"
+
+    def test_nan_delta_rejected(self) -> None:
+        """Test that a NaN perturbation raises instead of clipping to 1"""
+        with pytest.raises(ValueError, match="delta must not be NaN"):
+            perturbed_albedo("vegetation", float("nan"))
+
+
+class TestPerturbedAlbedoBatch:
+    """Tests for perturbed_albedo_batch function"""
+
+    def test_matches_scalar(self) -> None:
+        """Test that batch perturbation agrees with perturbed_albedo, including clipping"""
+        deltas = np.array([-1.0, -0.5, -0.1, 0.0, 0.1, 0.5, 1.0])
+        for surface in list_surface_types():
+            values = perturbed_albedo_batch(surface, deltas)
+            expected = [perturbed_albedo(surface, float(delta)) for delta in deltas]
+            np.testing.assert_array_equal(values, expected)
+
+    def test_physical_bounds_maintained(self) -> None:
+        """Test that every result is in [0, 1]"""
+        values = perturbed_albedo_batch("snow_fresh", np.linspace(-2.0, 2.0, 101))
+        assert ((values >= 0.0) & (values <= 1.0)).all()
+
+    def test_anchor(self) -> None:
+        """Test that the anchor selects the baseline"""
+        values = perturbed_albedo_batch("vegetation", [0.0], anchor="max")
+        assert values[0] == base_albedo("vegetation", anchor="max")
+
+    @pytest.mark.parametrize("delta", [0.1, np.array(0.1), 2.0], ids=["float", "0d_array", "clipped"])
+    def test_scalar_input(self, delta: float) -> None:
+        """Test that scalar and 0-d inputs give a 0-d result matching perturbed_albedo"""
+        values = perturbed_albedo_batch("vegetation", delta)
+        assert values.shape == ()
+        assert values == perturbed_albedo("vegetation", float(delta))
+
+    def test_input_not_modified(self) -> None:
+        """Test that the caller's delta array is left untouched"""
+        deltas = np.array([0.1, 2.0])
+        perturbed_albedo_batch("vegetation", deltas)
+        np.testing.assert_array_equal(deltas, [0.1, 2.0])
+
+    def test_nan_delta_rejected(self) -> None:
+        """Test that any NaN perturbation rejects the batch, matching perturbed_albedo"""
+        with pytest.raises(ValueError, match="delta must not be NaN"):
+            perturbed_albedo_batch("vegetation", [0.0, np.nan])
+
+    def test_composes_with_forcing_batch(self) -> None:
+        """Test that perturbed albedos feed the batch forcing API without a Python loop"""
+        deltas = np.array([-0.05, 0.0, 0.05])
+        base = base_albedo("urban")
+        forcings = delta_radiative_forcing_batch(perturbed_albedo_batch("urban", deltas) - base, 0.2)
+        expected = [delta_radiative_forcing(perturbed_albedo("urban", d) - base, area_fraction=0.2) for d in deltas]
+        np.testing.assert_allclose(forcings, [r.radiative_forcing_w_m2 for r in expected])
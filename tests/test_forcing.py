@@ -9,18 +9,34 @@ Tests radiative forcing calculations including:
 """
 
 import dataclasses
+import importlib.util
+import math
+import re
+import sys
+from typing import Optional
 
+import numpy as np
 import pytest
 
 from src.forcing import (
     GEOMETRIC_FACTOR,
     SOLAR_CONSTANT_W_M2,
     ForcingResult,
+    ForcingResultBatch,
+    _albedo_difference_unchecked,
+    _drf_core,
+    _forcing_kernel_py,
     albedo_difference,
     delta_radiative_forcing,
+    delta_radiative_forcing_batch,
+    make_forcing_fn,
     validate_delta_albedo,
 )
 
+# Shared error-message patterns, compiled once per module
+_RE_M11 = re.compile("between -1 and 1")
+_RE_01 = re.compile("between 0 and 1")
+
 
 class TestConstants:
     """Tests for physical constants"""
@@ -50,96 +66,271 @@ class TestForcingResult:
         with pytest.raises(dataclasses.FrozenInstanceError):
             result.delta_albedo = 0.02  # type: ignore
 
+    def test_fast_constructor_matches_init(self) -> None:
+        """Test that the internal fast constructor builds an equal, still-frozen result"""
+        result = ForcingResult._fast(0.01, 0.5, -1.7)
+        assert result == ForcingResult(delta_albedo=0.01, area_fraction=0.5, radiative_forcing_w_m2=-1.7)
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            result.area_fraction = 1.0  # type: ignore
+
+    @pytest.mark.skipif(sys.version_info < (3, 10), reason="dataclass slots require Python 3.10+")
+    def test_slots_present(self) -> None:
+        """Test that ForcingResult instances carry no per-instance __dict__"""
+        assert not hasattr(ForcingResult(0.0, 0.0, 0.0), "__dict__")
+
 
 class TestValidateDeltaAlbedo:
     """Tests for validate_delta_albedo function"""
 
-    def test_valid_delta_albedos(self) -> None:
-        """Test that valid delta albedos pass"""
-        assert validate_delta_albedo(0.0) == 0.0
-        assert validate_delta_albedo(-0.5) == -0.5
-        assert validate_delta_albedo(0.5) == 0.5
-        assert validate_delta_albedo(-1.0) == -1.0
-        assert validate_delta_albedo(1.0) == 1.0
+    def test_valid_delta_albedos(self, delta_batch: np.ndarray) -> None:
+        """Test that valid delta albedos pass, including the bounds"""
+        validated = np.fromiter((validate_delta_albedo(float(d)) for d in delta_batch), dtype=np.float64)
+        np.testing.assert_array_equal(validated, delta_batch)
 
-    def test_invalid_delta_too_negative(self) -> None:
-        """Test that delta < -1 raises ValueError"""
-        with pytest.raises(ValueError, match="between -1 and 1"):
-            validate_delta_albedo(-1.1)
+    def test_valid_delta_albedos_batch(self, delta_batch: np.ndarray) -> None:
+        """Test that the batch API accepts the same valid range"""
+        assert delta_radiative_forcing_batch(delta_batch).shape == delta_batch.shape
 
-    def test_invalid_delta_too_positive(self) -> None:
-        """Test that delta > 1 raises ValueError"""
-        with pytest.raises(ValueError, match="between -1 and 1"):
-            validate_delta_albedo(1.1)
+    @pytest.mark.parametrize("delta", [-1.1, 1.1, -2.0, 2.0], ids=["too_negative", "too_positive", "-2", "+2"])
+    def test_invalid_delta(self, delta: float) -> None:
+        """Test that delta outside [-1, 1] raises ValueError"""
+        with pytest.raises(ValueError, match=_RE_M11):
+            validate_delta_albedo(delta)
 
 
-class TestDeltaRadiativeForcing:
-    """Tests for delta_radiative_forcing function"""
+# (delta_albedo, area_fraction, solar_constant, geometric_factor, expected sign of forcing);
+# None leaves the argument at its default.
+_FORCING_CASES = [
+    pytest.param(0.0, 1.0, None, None, 0, id="zero_delta"),
+    pytest.param(0.01, 1.0, None, None, -1, id="brightening_cools"),
+    pytest.param(-0.01, 1.0, None, None, 1, id="darkening_warms"),
+    pytest.param(1.0, 1.0, None, None, -1, id="unit_albedo_change"),
+    pytest.param(0.01, 0.5, None, None, -1, id="half_globe"),
+    pytest.param(0.05, 0.75, None, None, -1, id="partial_area"),
+    pytest.param(0.01, 1.0, 1400.0, None, -1, id="custom_solar_constant"),
+    pytest.param(0.01, 1.0, None, 0.3, -1, id="custom_geometric_factor"),
+]
 
-    def test_zero_delta_albedo(self) -> None:
-        """Test that zero albedo change gives zero forcing"""
-        result = delta_radiative_forcing(0.0)
-        assert result.radiative_forcing_w_m2 == 0.0
 
-    def test_positive_delta_gives_negative_forcing(self) -> None:
-        """Test that brightening (positive delta) gives negative forcing (cooling)"""
-        result = delta_radiative_forcing(0.01)
-        assert result.radiative_forcing_w_m2 < 0.0
+class TestDeltaRadiativeForcing:
+    """Tests for delta_radiative_forcing function"""
 
-    def test_negative_delta_gives_positive_forcing(self) -> None:
-        """Test that darkening (negative delta) gives positive forcing (warming)"""
-        result = delta_radiative_forcing(-0.01)
-        assert result.radiative_forcing_w_m2 > 0.0
+    @pytest.mark.parametrize("delta,area,s0,geom,sign", _FORCING_CASES)
+    def test_delta_rf(self, delta: float, area: float, s0: Optional[float], geom: Optional[float], sign: int) -> None:
+        """Test sign convention, analytic value and echoed inputs for each case"""
+        kwargs: dict[str, float] = {}
+        if s0 is not None:
+            kwargs["solar_constant"] = s0
+        if geom is not None:
+            kwargs["geometric_factor"] = geom
+        result = delta_radiative_forcing(delta, area_fraction=area, **kwargs)
+
+        rf = result.radiative_forcing_w_m2
+        assert (rf > 0) - (rf < 0) == sign
+        expected = -(s0 or SOLAR_CONSTANT_W_M2) * (geom or GEOMETRIC_FACTOR) * delta * area
+        assert rf == pytest.approx(expected)
+        assert result.delta_albedo == delta
+        assert result.area_fraction == area
 
     def test_ipcc_benchmark_value(self) -> None:
         """Test against IPCC benchmark: +0.01 albedo -> ~-3.4 W/m^2"""
         result = delta_radiative_forcing(0.01, area_fraction=1.0)
-        expected = -SOLAR_CONSTANT_W_M2 * GEOMETRIC_FACTOR * 0.01
-        assert abs(result.radiative_forcing_w_m2 - expected) < 0.01
-
-    def test_unit_albedo_change(self) -> None:
-        """Test that unit albedo change gives ~-340 W/m^2"""
-        result = delta_radiative_forcing(1.0, area_fraction=1.0)
-        expected = -SOLAR_CONSTANT_W_M2 * GEOMETRIC_FACTOR
-        assert abs(result.radiative_forcing_w_m2 - expected) < 1.0
+        assert result.radiative_forcing_w_m2 == pytest.approx(-3.4, abs=0.01)
 
     def test_area_fraction_scaling(self) -> None:
         """Test that area fraction correctly scales forcing"""
         full = delta_radiative_forcing(0.01, area_fraction=1.0)
         half = delta_radiative_forcing(0.01, area_fraction=0.5)
-        assert abs(half.radiative_forcing_w_m2 - full.radiative_forcing_w_m2 / 2) < 0.01
-
-    def test_invalid_area_fraction_negative(self) -> None:
-        """Test that negative area fraction raises ValueError"""
-        with pytest.raises(ValueError, match="between 0 and 1"):
-            delta_radiative_forcing(0.01, area_fraction=-0.1)
-
-    def test_invalid_area_fraction_too_large(self) -> None:
-        """Test that area fraction > 1 raises ValueError"""
-        with pytest.raises(ValueError, match="between 0 and 1"):
-            delta_radiative_forcing(0.01, area_fraction=1.1)
-
-    def test_custom_solar_constant(self) -> None:
-        """Test with custom solar constant"""
-        custom_s0 = 1400.0
-        result = delta_radiative_forcing(0.01, solar_constant=custom_s0, area_fraction=1.0)
-        expected = -custom_s0 * GEOMETRIC_FACTOR * 0.01
-        assert abs(result.radiative_forcing_w_m2 - expected) < 0.01
-
-    def test_custom_geometric_factor(self) -> None:
-        """Test with custom geometric factor"""
-        custom_geom = 0.3
-        result = delta_radiative_forcing(0.01, geometric_factor=custom_geom, area_fraction=1.0)
-        expected = -SOLAR_CONSTANT_W_M2 * custom_geom * 0.01
-        assert abs(result.radiative_forcing_w_m2 - expected) < 0.01
-
-    def test_result_contains_inputs(self) -> None:
-        """Test that result contains the input parameters"""
-        delta = 0.05
-        area = 0.75
-        result = delta_radiative_forcing(delta, area_fraction=area)
-        assert result.delta_albedo == delta
-        assert result.area_fraction == area
+        assert half.radiative_forcing_w_m2 == pytest.approx(full.radiative_forcing_w_m2 / 2, abs=0.01)
+
+    @pytest.mark.parametrize("delta", [0.0, -0.0, 0], ids=["zero", "negative_zero", "int_zero"])
+    def test_zero_delta_matches_general_formula(self, delta: float) -> None:
+        """Test that a zero delta returns the same signed zero as the full product"""
+        rf = delta_radiative_forcing(delta, area_fraction=0.5).radiative_forcing_w_m2
+        expected = -SOLAR_CONSTANT_W_M2 * GEOMETRIC_FACTOR * delta * 0.5
+        assert isinstance(rf, float)
+        assert math.copysign(1.0, rf) == math.copysign(1.0, expected)
+
+    def test_zero_delta_uses_custom_constants(self) -> None:
+        """Test that a zero delta still propagates non-default constants through the product"""
+        assert math.isnan(delta_radiative_forcing(0.0, solar_constant=math.nan).radiative_forcing_w_m2)
+        rf = delta_radiative_forcing(0.0, solar_constant=-1361.0).radiative_forcing_w_m2
+        assert math.copysign(1.0, rf) == 1.0
+
+    def test_zero_delta_still_validates_area(self) -> None:
+        """Test that a zero delta does not bypass the area fraction check"""
+        with pytest.raises(ValueError, match=_RE_01):
+            delta_radiative_forcing(0.0, area_fraction=1.5)
+
+    def test_folded_constant_matches_explicit(self, delta_batch: np.ndarray) -> None:
+        """Test that the precomputed S0 * g default equals passing equal constants explicitly"""
+        # float(str(...)) builds equal but distinct objects, which skip the identity fast path.
+        s0, geom = float(str(SOLAR_CONSTANT_W_M2)), float(str(GEOMETRIC_FACTOR))
+        assert s0 is not SOLAR_CONSTANT_W_M2
+        for delta in delta_batch:
+            default = delta_radiative_forcing(delta, area_fraction=0.3)
+            explicit = delta_radiative_forcing(delta, area_fraction=0.3, solar_constant=s0, geometric_factor=geom)
+            assert default == explicit
+        np.testing.assert_array_equal(
+            delta_radiative_forcing_batch(delta_batch, 0.3),
+            delta_radiative_forcing_batch(delta_batch, 0.3, solar_constant=s0, geometric_factor=geom),
+        )
+
+    @pytest.mark.parametrize("area", [-0.1, 1.1], ids=["negative", "too_large"])
+    def test_invalid_area_fraction(self, area: float) -> None:
+        """Test that area fraction outside [0, 1] raises ValueError"""
+        with pytest.raises(ValueError, match=_RE_01):
+            delta_radiative_forcing(0.01, area_fraction=area)
+
+
+class TestDeltaRadiativeForcingBatch:
+    """Tests for delta_radiative_forcing_batch function"""
+
+    def test_matches_scalar(self) -> None:
+        """Test that batch results agree with the scalar function"""
+        deltas = np.array([-0.05, -0.02, 0.0, 0.02, 0.05])
+        areas = np.array([0.1, 0.25, 0.5, 0.75, 1.0])
+        batch = delta_radiative_forcing_batch(deltas, areas)
+        expected = [delta_radiative_forcing(d, area_fraction=a).radiative_forcing_w_m2 for d, a in zip(deltas, areas)]
+        np.testing.assert_array_equal(batch, expected)
+
+    def test_bitwise_agreement_with_scalar(self) -> None:
+        """Test that batch and scalar paths round identically over a dense sweep"""
+        deltas = np.linspace(-1.0, 1.0, 2001)
+        areas = np.linspace(0.0, 1.0, 2001)
+        batch = delta_radiative_forcing_batch(deltas, areas)
+        expected = [
+            delta_radiative_forcing(float(d), area_fraction=float(a)).radiative_forcing_w_m2
+            for d, a in zip(deltas, areas)
+        ]
+        np.testing.assert_array_equal(batch, expected)
+
+    def test_monotonic_in_delta(self) -> None:
+        """Test that more brightening gives more negative forcing across a batch"""
+        deltas = np.array([-0.05, -0.02, 0.0, 0.02, 0.05])
+        forcings = delta_radiative_forcing_batch(deltas, area_fraction=0.5)
+        assert np.all(np.diff(forcings) < 0)
+
+    def test_broadcasts_scalar_area(self) -> None:
+        """Test that a scalar area fraction broadcasts over the deltas"""
+        deltas = np.array([0.01, 0.02])
+        batch = delta_radiative_forcing_batch(deltas, 0.5)
+        assert batch.shape == (2,)
+        np.testing.assert_allclose(batch, -SOLAR_CONSTANT_W_M2 * GEOMETRIC_FACTOR * deltas * 0.5)
+
+    def test_accepts_lists(self) -> None:
+        """Test that plain sequences are accepted and a float array is returned"""
+        batch = delta_radiative_forcing_batch([0.01, -0.01])
+        assert batch.dtype == np.float64
+        assert batch[0] < 0.0 < batch[1]
+
+    def test_custom_constants(self) -> None:
+        """Test with custom solar constant and geometric factor"""
+        batch = delta_radiative_forcing_batch([0.01], solar_constant=1400.0, geometric_factor=0.3)
+        np.testing.assert_allclose(batch, [-1400.0 * 0.3 * 0.01])
+
+    def test_empty_input(self) -> None:
+        """Test that an empty batch passes validation and returns an empty array"""
+        batch = delta_radiative_forcing_batch(np.array([]))
+        assert batch.shape == (0,)
+
+    def test_invalid_delta_rejected(self) -> None:
+        """Test that any out-of-range delta rejects the batch"""
+        with pytest.raises(ValueError, match=_RE_M11):
+            delta_radiative_forcing_batch([0.01, 1.1])
+
+    def test_invalid_area_fraction_rejected(self) -> None:
+        """Test that any out-of-range area fraction rejects the batch"""
+        with pytest.raises(ValueError, match=_RE_01):
+            delta_radiative_forcing_batch([0.01, 0.02], [0.5, -0.1])
+
+    @pytest.mark.parametrize(
+        "delta,area,match",
+        [(np.nan, 1.0, _RE_M11), (0.01, np.nan, _RE_01)],
+        ids=["nan_delta", "nan_area"],
+    )
+    def test_nan_rejected(self, delta: float, area: float, match: "re.Pattern[str]") -> None:
+        """Test that NaN inputs reject the batch, as they do in the scalar function"""
+        with pytest.raises(ValueError, match=match):
+            delta_radiative_forcing_batch([0.01, delta], area)
+        with pytest.raises(ValueError, match=match):
+            delta_radiative_forcing(delta, area_fraction=area)
+
+
+class TestForcingResultBatch:
+    """Tests for the ForcingResultBatch container"""
+
+    def test_compute_columns(self, delta_batch: np.ndarray) -> None:
+        """Test that compute broadcasts inputs into aligned columns"""
+        batch = ForcingResultBatch.compute(delta_batch, area_fraction=0.5)
+        assert len(batch) == len(delta_batch)
+        np.testing.assert_array_equal(batch.delta_albedo, delta_batch)
+        np.testing.assert_array_equal(batch.area_fraction, np.full(len(delta_batch), 0.5))
+        np.testing.assert_array_equal(batch.radiative_forcing_w_m2, delta_radiative_forcing_batch(delta_batch, 0.5))
+
+    def test_getitem_matches_scalar(self, delta_batch: np.ndarray) -> None:
+        """Test that indexing yields the scalar ForcingResult"""
+        batch = ForcingResultBatch.compute(delta_batch, area_fraction=0.25)
+        for i, delta in enumerate(delta_batch):
+            assert batch[i] == delta_radiative_forcing(delta, area_fraction=0.25)
+
+    def test_invalid_input(self) -> None:
+        """Test that out-of-range inputs are rejected"""
+        with pytest.raises(ValueError, match="delta_albedo"):
+            ForcingResultBatch.compute([0.0, 2.0])
+
+    def test_columns_do_not_alias_inputs(self) -> None:
+        """Test that later edits to the caller's arrays do not reach the stored columns"""
+        deltas = np.array([0.1, 0.2])
+        batch = ForcingResultBatch.compute(deltas, area_fraction=0.5)
+        deltas[0] = 0.5
+        np.testing.assert_array_equal(batch.delta_albedo, [0.1, 0.2])
+        for column in (batch.delta_albedo, batch.area_fraction, batch.radiative_forcing_w_m2):
+            assert not column.flags.writeable
+            assert column.flags.owndata
+        with pytest.raises(ValueError):
+            batch.radiative_forcing_w_m2[0] = 0.0
+
+    def test_equality_is_identity(self) -> None:
+        """Test that comparing and hashing batches does not touch the array fields"""
+        batch = ForcingResultBatch.compute([0.01, 0.02])
+        other = ForcingResultBatch.compute([0.01, 0.02])
+        assert batch == batch
+        assert batch != other
+        assert hash(batch) == hash(batch)
+
+    def test_scalar_input(self) -> None:
+        """Test that scalar inputs become length-1 columns"""
+        batch = ForcingResultBatch.compute(0.01, area_fraction=0.5)
+        assert len(batch) == 1
+        assert batch[0] == delta_radiative_forcing(0.01, area_fraction=0.5)
+
+    def test_rejects_2d_input(self) -> None:
+        """Test that inputs broadcasting to more than one dimension raise ValueError"""
+        with pytest.raises(ValueError, match="1-D"):
+            ForcingResultBatch.compute([[0.01, 0.02]], area_fraction=[[0.5], [1.0]])
+
+
+class TestMakeForcingFn:
+    """Tests for make_forcing_fn specialization"""
+
+    @pytest.mark.parametrize("jit", [False, True])
+    def test_matches_delta_radiative_forcing(self, jit: bool) -> None:
+        """Test that the specialized function reproduces the scalar forcing exactly"""
+        forcing_fn = make_forcing_fn(jit=jit)
+        for delta, area in [(0.01, 1.0), (-0.02, 0.5), (0.0, 0.3)]:
+            expected = delta_radiative_forcing(delta, area_fraction=area).radiative_forcing_w_m2
+            assert forcing_fn(delta, area) == expected
+
+    def test_default_area_fraction(self) -> None:
+        """Test that area_fraction defaults to global"""
+        forcing_fn = make_forcing_fn()
+        assert forcing_fn(0.01) == delta_radiative_forcing(0.01).radiative_forcing_w_m2
+
+    def test_custom_constants(self) -> None:
+        """Test that custom constants are baked into the returned function"""
+        forcing_fn = make_forcing_fn(1400.0, 0.3)
+        assert forcing_fn(0.01, 1.0) == pytest.approx(-1400.0 * 0.3 * 0.01)
 
 
 class TestAlbedoDifference:
@@ -149,15 +340,17 @@ class TestAlbedoDifference:
         """Test that identical albedos give zero difference"""
         assert albedo_difference(0.5, 0.5) == 0.0
 
-    def test_brightening(self) -> None:
-        """Test positive delta for brightening"""
-        delta = albedo_difference(0.3, 0.4)
-        assert delta == pytest.approx(0.1)
+    def test_pairs(self, albedo_pairs: np.ndarray) -> None:
+        """Test brightening, darkening and extreme pairs against final - initial"""
+        initial, final = albedo_pairs[:, 0], albedo_pairs[:, 1]
+        deltas = np.fromiter((albedo_difference(float(i), float(f)) for i, f in albedo_pairs), dtype=np.float64)
+        np.testing.assert_array_equal(deltas, final - initial)
+        np.testing.assert_allclose(deltas, [0.1, -0.1, -1.0, 1.0])
 
-    def test_darkening(self) -> None:
-        """Test negative delta for darkening"""
-        delta = albedo_difference(0.4, 0.3)
-        assert delta == pytest.approx(-0.1)
+    def test_unchecked_matches_checked(self, albedo_pairs: np.ndarray) -> None:
+        """Test that the unchecked internal helper agrees with albedo_difference on valid inputs"""
+        for initial, final in albedo_pairs:
+            assert _albedo_difference_unchecked(initial, final) == albedo_difference(initial, final)
 
     def test_order_matters(self) -> None:
         """Test that order of arguments matters (final - initial)"""
@@ -165,32 +358,15 @@ class TestAlbedoDifference:
         backward = albedo_difference(0.4, 0.3)
         assert forward == -backward
 
-    def test_invalid_initial_albedo_negative(self) -> None:
-        """Test that negative initial albedo raises ValueError"""
-        with pytest.raises(ValueError, match="between 0 and 1"):
-            albedo_difference(-0.1, 0.5)
-
-    def test_invalid_initial_albedo_too_large(self) -> None:
-        """Test that initial albedo > 1 raises ValueError"""
-        with pytest.raises(ValueError, match="between 0 and 1"):
-            albedo_difference(1.1, 0.5)
-
-    def test_invalid_final_albedo_negative(self) -> None:
-        """Test that negative final albedo raises ValueError"""
-        with pytest.raises(ValueError, match="between 0 and 1"):
-            albedo_difference(0.5, -0.1)
-
-    def test_invalid_final_albedo_too_large(self) -> None:
-        """Test that final albedo > 1 raises ValueError"""
-        with pytest.raises(ValueError, match="between 0 and 1"):
-            albedo_difference(0.5, 1.1)
-
-    def test_extreme_values(self) -> None:
-        """Test with extreme but valid values"""
-        # Complete darkening
-        assert albedo_difference(1.0, 0.0) == -1.0
-        # Complete brightening
-        assert albedo_difference(0.0, 1.0) == 1.0
+    @pytest.mark.parametrize(
+        "initial,final",
+        [(-0.1, 0.5), (1.1, 0.5), (0.5, -0.1), (0.5, 1.1)],
+        ids=["initial_negative", "initial_too_large", "final_negative", "final_too_large"],
+    )
+    def test_invalid_albedo(self, initial: float, final: float) -> None:
+        """Test that albedos outside [0, 1] raise ValueError"""
+        with pytest.raises(ValueError, match=_RE_01):
+            albedo_difference(initial, final)
 
 
 class TestIntegration:
@@ -207,4 +383,38 @@ class TestIntegration:
         assert result.radiative_forcing_w_m2 > 0
         # Should be approximately half of full-globe value
         full_result = delta_radiative_forcing(delta, area_fraction=1.0)
-        assert abs(result.radiative_forcing_w_m2 - full_result.radiative_forcing_w_m2 / 2) < 0.01
+        assert result.radiative_forcing_w_m2 == pytest.approx(full_result.radiative_forcing_w_m2 / 2, abs=0.01)
+
+
+class TestForcingKernelBackends:
+    """Tests that every available kernel backend agrees with the reference formula"""
+
+    _CASES = [(0.30, 0.28, 0.5), (0.2, 0.25, 1.0), (0.0, 1.0, 0.1), (1.5, 0.5, 1.0), (0.5, 0.5, -0.1)]
+
+    def _reference(self, initial: float, final: float, area: float) -> float:
+        if not (0.0 <= initial <= 1.0 and 0.0 <= final <= 1.0 and 0.0 <= area <= 1.0):
+            return float("nan")
+        return -SOLAR_CONSTANT_W_M2 * GEOMETRIC_FACTOR * (final - initial) * area
+
+    @pytest.mark.parametrize("delta", np.linspace(-1.0, 1.0, 9).tolist())
+    def test_core_matches_scalar_path(self, delta: float) -> None:
+        """Test that the shared forcing core matches the scalar Python path"""
+        for area in (0.0, 0.25, 1.0):
+            got = _drf_core(delta, area, SOLAR_CONSTANT_W_M2, GEOMETRIC_FACTOR)
+            expected = delta_radiative_forcing(delta, area_fraction=area).radiative_forcing_w_m2
+            assert got == pytest.approx(expected, rel=1e-12, abs=1e-12)
+
+    def test_scalar_kernel(self) -> None:
+        """Test the pure-Python kernel"""
+        for initial, final, area in self._CASES:
+            got = _forcing_kernel_py(initial, final, area, SOLAR_CONSTANT_W_M2, GEOMETRIC_FACTOR)
+            np.testing.assert_array_equal(got, self._reference(initial, final, area))
+
+    @pytest.mark.skipif(importlib.util.find_spec("src._forcing_c") is None, reason="Cython kernel not built")
+    def test_cython_kernel(self) -> None:
+        """Test the optional compiled Cython kernel"""
+        from src._forcing_c import forcing_kernel
+
+        for initial, final, area in self._CASES:
+            got = forcing_kernel(initial, final, area, SOLAR_CONSTANT_W_M2, GEOMETRIC_FACTOR)
+            np.testing.assert_array_equal(got, self._reference(initial, final, area))
@@ -7,11 +7,20 @@ Tests the model pipeline including:
 - End-to-end workflows
 """
 
+import re
+from typing import TYPE_CHECKING, Union
+
+import numpy as np
 import pytest
 
-from src import albedo
-from src.forcing import ForcingResult
-from src.model import Scenario, albedo_pipeline
+from src.forcing import GEOMETRIC_FACTOR, SOLAR_CONSTANT_W_M2, ForcingResult, delta_radiative_forcing
+from src.model import PipelineResult, Scenario, _sweep_kernel_numpy, albedo_pipeline, forcing_sweep
+
+# Shared error-message patterns, compiled once per module
+_RE_01 = re.compile("between 0 and 1")
+
+if TYPE_CHECKING:
+    from src.albedo import Anchor
 
 
 class TestScenario:
@@ -48,16 +57,29 @@ class TestScenario:
         # Brightening should give negative forcing (cooling)
         assert result.radiative_forcing_w_m2 < 0
 
+    def test_scenario_matches_forcing_module(self) -> None:
+        """Test that the fused scenario path agrees with delta_radiative_forcing"""
+        scenario = Scenario(initial_albedo=0.30, final_albedo=0.28, area_fraction=0.5)
+        result = scenario.forcing()
+        expected = delta_radiative_forcing(0.28 - 0.30, area_fraction=0.5)
+        assert result == expected
+
+    def test_scenario_invalid_area_fraction(self) -> None:
+        """Test that invalid area fraction raises error"""
+        scenario = Scenario(initial_albedo=0.3, final_albedo=0.28, area_fraction=1.5)
+        with pytest.raises(ValueError, match="area_fraction"):
+            scenario.forcing()
+
     def test_scenario_invalid_initial_albedo(self) -> None:
         """Test that invalid initial albedo raises error"""
         scenario = Scenario(initial_albedo=1.5, final_albedo=0.5)
-        with pytest.raises(ValueError):
+        with pytest.raises(ValueError, match="initial_albedo"):
             scenario.forcing()
 
     def test_scenario_invalid_final_albedo(self) -> None:
         """Test that invalid final albedo raises error"""
         scenario = Scenario(initial_albedo=0.5, final_albedo=-0.1)
-        with pytest.raises(ValueError):
+        with pytest.raises(ValueError, match="final_albedo"):
             scenario.forcing()
 
 
@@ -74,6 +96,14 @@ class TestAlbedoPipeline:
         # Darkening should give positive forcing
         assert forcing_result.radiative_forcing_w_m2 > 0
 
+    def test_pipeline_named_fields(self) -> None:
+        """Test that the result exposes scenario and forcing by name and unpacks positionally"""
+        result = albedo_pipeline(surface_type="vegetation", albedo_delta=-0.02)
+        assert isinstance(result, PipelineResult)
+        scenario, forcing_result = result
+        assert result.scenario is scenario
+        assert result.forcing is forcing_result
+
     def test_pipeline_zero_delta(self) -> None:
         """Test pipeline with zero perturbation"""
         scenario, forcing_result = albedo_pipeline(surface_type="vegetation", albedo_delta=0.0)
@@ -88,23 +118,13 @@ class TestAlbedoPipeline:
             assert isinstance(scenario, Scenario)
             assert isinstance(forcing_result, ForcingResult)
 
-    def test_pipeline_anchor_typical(self) -> None:
-        """Test pipeline with typical anchor"""
-        scenario, _ = albedo_pipeline(surface_type="vegetation", anchor="typical")
-        expected_base = albedo.base_albedo("vegetation", anchor="typical")
-        assert scenario.initial_albedo == expected_base
-
-    def test_pipeline_anchor_min(self) -> None:
-        """Test pipeline with min anchor"""
-        scenario, _ = albedo_pipeline(surface_type="vegetation", anchor="min")
-        expected_base = albedo.base_albedo("vegetation", anchor="min")
-        assert scenario.initial_albedo == expected_base
+    @pytest.mark.parametrize("anchor", ["typical", "min", "max"])
+    def test_pipeline_anchor(self, anchor: "Anchor") -> None:
+        """Test that the pipeline starts from the requested anchor's base albedo"""
+        from src import albedo
 
-    def test_pipeline_anchor_max(self) -> None:
-        """Test pipeline with max anchor"""
-        scenario, _ = albedo_pipeline(surface_type="vegetation", anchor="max")
-        expected_base = albedo.base_albedo("vegetation", anchor="max")
-        assert scenario.initial_albedo == expected_base
+        scenario, _ = albedo_pipeline(surface_type="vegetation", anchor=anchor)
+        assert scenario.initial_albedo == albedo.base_albedo("vegetation", anchor=anchor)
 
     def test_pipeline_positive_delta(self) -> None:
         """Test pipeline with positive perturbation (brightening)"""
@@ -127,7 +147,17 @@ class TestAlbedoPipeline:
         _, full = albedo_pipeline("vegetation", -0.02, area_fraction=1.0)
         _, half = albedo_pipeline("vegetation", -0.02, area_fraction=0.5)
 
-        assert abs(half.radiative_forcing_w_m2 - full.radiative_forcing_w_m2 / 2) < 0.01
+        assert half.radiative_forcing_w_m2 == pytest.approx(full.radiative_forcing_w_m2 / 2, abs=0.01)
+
+    def test_pipeline_matches_scenario_forcing(self) -> None:
+        """Test that the pipeline result equals recomputing forcing from its scenario"""
+        scenario, forcing_result = albedo_pipeline("desert", -0.03, area_fraction=0.2)
+        assert forcing_result == scenario.forcing()
+
+    def test_pipeline_invalid_area_fraction(self) -> None:
+        """Test that invalid area fraction raises error"""
+        with pytest.raises(ValueError, match="area_fraction"):
+            albedo_pipeline("vegetation", -0.02, area_fraction=1.5)
 
     def test_pipeline_invalid_surface(self) -> None:
         """Test that invalid surface type raises error"""
@@ -148,6 +178,8 @@ class TestEndToEndWorkflows:
 
     def test_deforestation_scenario(self) -> None:
         """Test realistic deforestation scenario (vegetation -> cropland)"""
+        from src import albedo
+
         # Deforestation typically darkens surface slightly
         veg_albedo = albedo.base_albedo("vegetation")
         crop_albedo = albedo.base_albedo("cropland")
@@ -185,16 +217,76 @@ class TestEndToEndWorkflows:
 
     def test_multiple_scenarios_comparison(self) -> None:
         """Test comparing multiple scenarios"""
-        scenarios = []
-
         # Different perturbations on same surface
-        for delta in [-0.05, -0.02, 0.0, 0.02, 0.05]:
-            _, forcing = albedo_pipeline("vegetation", delta, area_fraction=0.5)
-            scenarios.append((delta, forcing.radiative_forcing_w_m2))
+        deltas = np.array([-0.05, -0.02, 0.0, 0.02, 0.05])
+        forcings = np.fromiter(
+            (albedo_pipeline("vegetation", d, area_fraction=0.5).forcing.radiative_forcing_w_m2 for d in deltas),
+            dtype=np.float64,
+            count=deltas.size,
+        )
 
         # Check monotonic relationship: more darkening -> more positive forcing
-        for i in range(len(scenarios) - 1):
-            delta1, forcing1 = scenarios[i]
-            delta2, forcing2 = scenarios[i + 1]
-            assert delta1 < delta2
-            assert forcing1 > forcing2  # More negative delta -> more positive forcing
+        assert np.all(np.diff(deltas) > 0)
+        assert np.all(np.diff(forcings) < 0)
+
+
+class TestForcingSweep:
+    """Tests for forcing_sweep batch scenarios"""
+
+    def test_matches_pipeline(self) -> None:
+        """Test that every sweep element equals the corresponding albedo_pipeline result"""
+        from src import albedo
+
+        surfaces = list(albedo.list_surface_types())
+        deltas = [-1.0, -0.05, 0.0, 0.05, 0.5]
+        areas = [0.1, 0.5, 1.0]
+        grid = [(s, d, a) for s in surfaces for d in deltas for a in areas]
+        bases = albedo.base_albedo_many([s for s, _, _ in grid])
+        sweep = forcing_sweep(bases, [d for _, d, _ in grid], [a for _, _, a in grid])
+        expected = [albedo_pipeline(s, d, area_fraction=a).forcing.radiative_forcing_w_m2 for s, d, a in grid]
+        np.testing.assert_allclose(sweep, expected, rtol=1e-12, atol=1e-12)
+
+    def test_numpy_fallback_matches(self) -> None:
+        """Test that the NumPy fallback kernel agrees with forcing_sweep"""
+        bases = np.array([0.0, 0.2, 0.78, 1.0])
+        deltas = np.array([-0.5, 0.05, -5.0, 0.5])
+        areas = np.array([1.0, 0.5, 0.1, 1.0])
+        got = _sweep_kernel_numpy(bases, deltas, areas, SOLAR_CONSTANT_W_M2, GEOMETRIC_FACTOR)
+        np.testing.assert_allclose(got, forcing_sweep(bases, deltas, areas), rtol=1e-12, atol=1e-12)
+
+    def test_broadcast_shape(self) -> None:
+        """Test that inputs broadcast to an outer-product grid"""
+        from src import albedo
+
+        bases = albedo.base_albedo_many(["vegetation", "desert"])[:, None]
+        deltas = np.linspace(-0.05, 0.05, 5)[None, :]
+        sweep = forcing_sweep(bases, deltas, 0.5)
+        assert sweep.shape == (2, 5)
+        # More darkening -> more positive forcing along each row
+        assert (np.diff(sweep, axis=1) < 0).all()
+
+    def test_clipping(self) -> None:
+        """Test that perturbations are clipped to physical bounds before differencing"""
+        sweep = forcing_sweep([0.78], [-5.0])
+        expected = delta_radiative_forcing(-0.78).radiative_forcing_w_m2
+        assert sweep[0] == pytest.approx(expected)
+
+    def test_invalid_base_albedo(self) -> None:
+        """Test that an out-of-range baseline albedo raises ValueError"""
+        with pytest.raises(ValueError, match=_RE_01):
+            forcing_sweep([0.2, 1.2], [0.0, 0.0])
+
+    def test_invalid_area_fraction(self) -> None:
+        """Test that an out-of-range area fraction raises ValueError"""
+        with pytest.raises(ValueError, match="area_fraction"):
+            forcing_sweep([0.2], [0.0], [1.5])
+
+    @pytest.mark.parametrize(
+        "bases,deltas,areas",
+        [([np.nan], [0.0], 1.0), ([0.2], [np.nan], 1.0), ([0.2], [0.0], [np.nan])],
+        ids=["nan_base", "nan_delta", "nan_area"],
+    )
+    def test_nan_rejected(self, bases: list[float], deltas: list[float], areas: Union[float, list[float]]) -> None:
+        """Test that NaN in any input raises ValueError instead of producing NaN forcing"""
+        with pytest.raises(ValueError):
+            forcing_sweep(bases, deltas, areas)
@@ -0,0 +1,58 @@
+"""
+Tests for the package namespace (src/__init__.py)
+
+Tests lazy re-exports including:
+- Deferred submodule imports
+- Attribute resolution and caching
+- __all__ / dir() consistency
+"""
+
+import subprocess
+import sys
+
+import pytest
+
+import src
+
+
+class TestLazyExports:
+    """Tests for PEP 562 lazy attribute access"""
+
+    def test_import_does_not_load_submodules(self) -> None:
+        """Test that importing the package alone loads no submodule or NumPy"""
+        code = (
+            "import sys, src; "
+            "loaded = [m for m in ('src.albedo', 'src.forcing', 'src.model', 'src.validation', 'numpy') "
+            "if m in sys.modules]; "
+            "print(','.join(loaded))"
+        )
+        out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+        assert out.stdout.strip() == ""
+
+    @pytest.mark.parametrize("module", ["src.albedo", "src.forcing", "src.model", "src.validation"])
+    def test_submodule_import_does_not_load_numba(self, module: str) -> None:
+        """Test that importing a submodule leaves Numba unloaded until a kernel is compiled"""
+        code = f"import sys, {module}; print('numba' in sys.modules)"
+        out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+        assert out.stdout.strip() == "False"
+
+    def test_all_names_resolve(self) -> None:
+        """Test that every name in __all__ is reachable from the package"""
+        for name in src.__all__:
+            assert getattr(src, name) is not None
+
+    def test_reexports_are_module_objects(self) -> None:
+        """Test that re-exported names are the submodule objects themselves"""
+        from src import forcing
+
+        assert src.delta_radiative_forcing is forcing.delta_radiative_forcing
+        assert src.forcing is forcing
+
+    def test_dir_lists_public_names(self) -> None:
+        """Test that dir() includes the lazily exported names"""
+        assert set(src.__all__) <= set(dir(src))
+
+    def test_unknown_attribute(self) -> None:
+        """Test that unknown names raise AttributeError"""
+        with pytest.raises(AttributeError, match="no attribute"):
+            src.not_a_real_name  # noqa: B018
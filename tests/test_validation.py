@@ -9,25 +9,48 @@ Tests validation against IPCC benchmarks including:
 """
 
 import dataclasses
+import math
+import re
+import sys
 
+import numpy as np
 import pytest
 
-from src.forcing import ForcingResult, delta_radiative_forcing
+from src.forcing import ForcingResult, delta_radiative_forcing, delta_radiative_forcing_batch
 from src.validation import (
     BENCHMARK_SENSITIVITY_W_M2_PER_DELTA_ALPHA,
     ValidationResult,
     expected_forcing_range,
     validate_area_fraction,
     validate_forcing_result,
+    validate_forcing_result_batch,
 )
 
+# Shared error-message patterns, compiled once per module
+_RE_01 = re.compile("between 0 and 1")
+
+# Benchmark forcing for a global +0.01 albedo change (-3.4 W m^-2)
+_EXPECTED_01 = BENCHMARK_SENSITIVITY_W_M2_PER_DELTA_ALPHA * 0.01
+
+
+@pytest.fixture(scope="module")
+def forcing_01_full() -> ForcingResult:
+    """Global +0.01 brightening, computed once per module (ForcingResult is frozen)"""
+    return delta_radiative_forcing(0.01, area_fraction=1.0)
+
+
+@pytest.fixture(scope="module")
+def forcing_zero() -> ForcingResult:
+    """Zero albedo change, computed once per module"""
+    return delta_radiative_forcing(0.0)
+
 
 class TestBenchmarkConstant:
     """Tests for benchmark sensitivity constant"""
 
     def test_benchmark_value(self) -> None:
         """Test that benchmark is approximately -340 W/m^2"""
-        assert abs(BENCHMARK_SENSITIVITY_W_M2_PER_DELTA_ALPHA + 340.0) < 10.0
+        assert BENCHMARK_SENSITIVITY_W_M2_PER_DELTA_ALPHA == pytest.approx(-340.0, abs=10.0)
 
 
 class TestValidationResult:
@@ -49,6 +72,11 @@ class TestValidationResult:
         with pytest.raises(dataclasses.FrozenInstanceError):
             result.within_range = False  # type: ignore
 
+    @pytest.mark.skipif(sys.version_info < (3, 10), reason="dataclass slots require Python 3.10+")
+    def test_slots_present(self) -> None:
+        """Test that ValidationResult instances carry no per-instance __dict__"""
+        assert not hasattr(ValidationResult((-4.0, -3.0), -3.5, True, "note"), "__dict__")
+
 
 class TestValidateAreaFraction:
     """Tests for validate_area_fraction function"""
@@ -61,12 +89,12 @@ class TestValidateAreaFraction:
 
     def test_invalid_area_fraction_negative(self) -> None:
         """Test that negative area fraction raises ValueError"""
-        with pytest.raises(ValueError, match="between 0 and 1"):
+        with pytest.raises(ValueError, match=_RE_01):
             validate_area_fraction(-0.1)
 
     def test_invalid_area_fraction_too_large(self) -> None:
         """Test that area fraction > 1 raises ValueError"""
-        with pytest.raises(ValueError, match="between 0 and 1"):
+        with pytest.raises(ValueError, match=_RE_01):
             validate_area_fraction(1.1)
 
 
@@ -79,6 +107,19 @@ class TestExpectedForcingRange:
         assert low == 0.0
         assert high == 0.0
 
+    @pytest.mark.parametrize("delta", [0.0, -0.0], ids=["zero", "negative_zero"])
+    def test_zero_delta_sign_matches_array_path(self, delta: float) -> None:
+        """Test that scalar and array paths return the same signed zeros"""
+        scalar = expected_forcing_range(delta, 0.5)
+        array = expected_forcing_range(np.array([delta]), 0.5)
+        for s_bound, a_bound in zip(scalar, array):
+            assert math.copysign(1.0, s_bound) == math.copysign(1.0, a_bound[0])
+
+    def test_zero_delta_still_validates_area(self) -> None:
+        """Test that a zero delta still rejects an invalid area fraction"""
+        with pytest.raises(ValueError, match=_RE_01):
+            expected_forcing_range(0.0, area_fraction=1.5)
+
     def test_positive_delta_negative_range(self) -> None:
         """Test that positive delta gives negative forcing range"""
         low, high = expected_forcing_range(0.01)
@@ -91,14 +132,16 @@ class TestExpectedForcingRange:
         # With ±20% tolerance: -3.4 ± 0.68 = [-4.08, -2.72]
         assert -4.5 < low < -3.5
         assert -3.0 < high < -2.0
+        assert low == pytest.approx(_EXPECTED_01 * 1.2)
+        assert high == pytest.approx(_EXPECTED_01 * 0.8)
 
     def test_area_fraction_scaling(self) -> None:
         """Test that area fraction scales the range"""
         full_low, full_high = expected_forcing_range(0.01, area_fraction=1.0)
         half_low, half_high = expected_forcing_range(0.01, area_fraction=0.5)
 
-        assert abs(half_low - full_low / 2) < 0.1
-        assert abs(half_high - full_high / 2) < 0.1
+        assert half_low == pytest.approx(full_low / 2, abs=0.1)
+        assert half_high == pytest.approx(full_high / 2, abs=0.1)
 
     def test_tolerance_fraction_effect(self) -> None:
         """Test that tolerance fraction widens the range"""
@@ -113,8 +156,7 @@ class TestExpectedForcingRange:
         """Test that tolerance is symmetric around benchmark"""
         low, high = expected_forcing_range(0.01, tolerance_fraction=0.2)
         center = (low + high) / 2
-        benchmark = BENCHMARK_SENSITIVITY_W_M2_PER_DELTA_ALPHA * 0.01
-        assert abs(center - benchmark) < 0.01
+        assert center == pytest.approx(_EXPECTED_01, abs=0.01)
 
     def test_negative_delta_albedo(self) -> None:
         """Test with negative delta (darkening)"""
@@ -123,41 +165,81 @@ class TestExpectedForcingRange:
         assert low > 0 and high > 0
 
 
+class TestExpectedForcingRangeArrays:
+    """Tests for the array path of expected_forcing_range"""
+
+    def test_matches_scalar(self) -> None:
+        """Test that array bounds agree with the scalar path element by element"""
+        deltas = np.array([-0.05, -0.01, 0.0, 0.01, 0.05])
+        areas = np.array([0.1, 0.25, 0.5, 0.75, 1.0])
+        low, high = expected_forcing_range(deltas, areas, tolerance_fraction=0.3)
+        expected = [expected_forcing_range(float(d), float(a), tolerance_fraction=0.3) for d, a in zip(deltas, areas)]
+        np.testing.assert_array_equal(low, [lo for lo, _ in expected])
+        np.testing.assert_array_equal(high, [hi for _, hi in expected])
+
+    def test_broadcasts_scalar_area(self) -> None:
+        """Test that a scalar area fraction broadcasts over array deltas"""
+        low, high = expected_forcing_range([0.01, 0.02], 0.5)
+        assert low.shape == high.shape == (2,)
+        assert (low < high).all()
+
+    def test_broadcasts_scalar_delta(self) -> None:
+        """Test that a scalar delta broadcasts over array area fractions"""
+        low, high = expected_forcing_range(0.01, np.array([0.5, 1.0]))
+        assert low.shape == high.shape == (2,)
+        assert high[1] == pytest.approx(2 * high[0])
+
+    def test_invalid_area_fraction(self) -> None:
+        """Test that any out-of-range area fraction raises ValueError"""
+        with pytest.raises(ValueError, match=_RE_01):
+            expected_forcing_range(np.array([0.01, 0.02]), np.array([0.5, 1.5]))
+
+    def test_nan_area_fraction(self) -> None:
+        """Test that a NaN area fraction is rejected, as on the scalar path"""
+        with pytest.raises(ValueError, match=_RE_01):
+            expected_forcing_range(np.array([0.01, 0.02]), np.array([0.5, np.nan]))
+        with pytest.raises(ValueError, match=_RE_01):
+            expected_forcing_range(0.01, float("nan"))
+
+
+# Artificial forcing values for a global +0.01 brightening (benchmark ~-3.4 W m^-2):
+# (modeled forcing, expected within_range)
+_BAD_CASES = [
+    pytest.param(100.0, False, id="unrealistic_positive"),
+    pytest.param(-100.0, False, id="unrealistic_negative"),
+    pytest.param(-3.4, True, id="benchmark"),
+]
+
+
 class TestValidateForcingResult:
     """Tests for validate_forcing_result function"""
 
-    def test_valid_result_within_range(self) -> None:
+    def test_valid_result_within_range(self, forcing_01_full: ForcingResult) -> None:
         """Test that result within expected range passes validation"""
-        # Create a forcing result that should be valid
-        forcing_result = delta_radiative_forcing(0.01, area_fraction=1.0)
-        validation = validate_forcing_result(forcing_result)
+        validation = validate_forcing_result(forcing_01_full)
 
         assert isinstance(validation, ValidationResult)
         assert validation.within_range is True
         assert "Within expected range" in validation.notes
 
-    def test_valid_result_matches_modeled_value(self) -> None:
+    def test_valid_result_matches_modeled_value(self, forcing_01_full: ForcingResult) -> None:
         """Test that validation contains the modeled value"""
-        forcing_result = delta_radiative_forcing(0.01, area_fraction=1.0)
-        validation = validate_forcing_result(forcing_result)
+        validation = validate_forcing_result(forcing_01_full)
 
-        assert validation.modeled_w_m2 == forcing_result.radiative_forcing_w_m2
+        assert validation.modeled_w_m2 == forcing_01_full.radiative_forcing_w_m2
 
-    def test_validation_range_reasonable(self) -> None:
+    def test_validation_range_reasonable(self, forcing_01_full: ForcingResult) -> None:
         """Test that expected range is reasonable"""
-        forcing_result = delta_radiative_forcing(0.01, area_fraction=1.0)
-        validation = validate_forcing_result(forcing_result)
+        validation = validate_forcing_result(forcing_01_full)
 
         low, high = validation.expected_range_w_m2
         assert low < high
         assert low < validation.modeled_w_m2 < high
 
-    def test_custom_tolerance(self) -> None:
+    def test_custom_tolerance(self, forcing_01_full: ForcingResult) -> None:
         """Test validation with custom tolerance"""
-        forcing_result = delta_radiative_forcing(0.01, area_fraction=1.0)
-
-        narrow = validate_forcing_result(forcing_result, tolerance_fraction=0.05)
-        wide = validate_forcing_result(forcing_result, tolerance_fraction=0.5)
+        narrow = validate_forcing_result(forcing_01_full, tolerance_fraction=0.05)
+        wide = validate_forcing_result(forcing_01_full, tolerance_fraction=0.5)
 
         narrow_low, narrow_high = narrow.expected_range_w_m2
         wide_low, wide_high = wide.expected_range_w_m2
@@ -175,20 +257,44 @@ class TestValidateForcingResult:
         # Should still be within range (scaled appropriately)
         assert validation.within_range is True
 
-    def test_zero_forcing_validates(self) -> None:
+    def test_zero_forcing_validates(self, forcing_zero: ForcingResult) -> None:
         """Test that zero forcing validates"""
-        forcing_result = delta_radiative_forcing(0.0)
-        validation = validate_forcing_result(forcing_result)
+        validation = validate_forcing_result(forcing_zero)
         assert validation.within_range is True
 
-    def test_extreme_values_might_fail(self) -> None:
-        """Test that extremely unrealistic values might fail validation"""
-        # Create an artificial ForcingResult with unrealistic forcing
-        # For delta=0.01, expected is ~-3.4, so 100 W/m^2 should fail
-        bad_result = ForcingResult(delta_albedo=0.01, area_fraction=1.0, radiative_forcing_w_m2=100.0)  # Unrealistic
-        validation = validate_forcing_result(bad_result, tolerance_fraction=0.2)
-        assert validation.within_range is False
-        assert "Outside expected range" in validation.notes
+    @pytest.mark.parametrize("rf,ok", _BAD_CASES)
+    def test_validation_boundary(self, rf: float, ok: bool) -> None:
+        """Test artificial forcing values against the +0.01 global benchmark range"""
+        result = ForcingResult(delta_albedo=0.01, area_fraction=1.0, radiative_forcing_w_m2=rf)
+        validation = validate_forcing_result(result, tolerance_fraction=0.2)
+        assert validation.within_range is ok
+        assert ("Within expected range" if ok else "Outside expected range") in validation.notes
+
+
+class TestValidateForcingResultBatch:
+    """Tests for validate_forcing_result_batch function"""
+
+    def test_matches_scalar(self) -> None:
+        """Test that the mask agrees with validate_forcing_result"""
+        deltas = np.array([0.01, 0.01, -0.02, 0.0])
+        areas = np.array([1.0, 1.0, 0.5, 1.0])
+        modeled = np.array([-3.4, 100.0, 3.4, 0.0])
+        mask = validate_forcing_result_batch(deltas, areas, modeled)
+        expected = [
+            validate_forcing_result(ForcingResult(d, a, m)).within_range for d, a, m in zip(deltas, areas, modeled)
+        ]
+        assert mask.dtype == np.bool_
+        assert mask.tolist() == expected
+
+    def test_model_output_validates(self) -> None:
+        """Test that batch-modeled forcing passes batch validation"""
+        deltas = np.array([-0.05, -0.02, -0.01, 0.01, 0.02, 0.05])
+        assert validate_forcing_result_batch(deltas, 0.5, delta_radiative_forcing_batch(deltas, 0.5)).all()
+
+    def test_custom_tolerance(self) -> None:
+        """Test that a tighter tolerance rejects a value a looser one accepts"""
+        assert not validate_forcing_result_batch([0.01], [1.0], [-3.0], tolerance_fraction=0.05)[0]
+        assert validate_forcing_result_batch([0.01], [1.0], [-3.0], tolerance_fraction=0.5)[0]
 
 
 class TestIntegrationWithForcing:
@@ -196,12 +302,10 @@ class TestIntegrationWithForcing:
 
     def test_typical_scenario_validates(self) -> None:
         """Test that typical scenarios pass validation"""
-        deltas = [-0.05, -0.02, -0.01, 0.01, 0.02, 0.05]
+        deltas = np.array([-0.05, -0.02, -0.01, 0.01, 0.02, 0.05])
+        forcings = delta_radiative_forcing_batch(deltas, area_fraction=0.5)
 
-        for delta in deltas:
-            forcing_result = delta_radiative_forcing(delta, area_fraction=0.5)
-            validation = validate_forcing_result(forcing_result)
-            assert validation.within_range is True
+        assert validate_forcing_result_batch(deltas, 0.5, forcings).all()
 
     def test_validation_across_area_fractions(self) -> None:
         """Test validation works for different area fractions"""
@@ -219,4 +323,4 @@ class TestIntegrationWithForcing:
 
         # Check it's close to benchmark
         expected = BENCHMARK_SENSITIVITY_W_M2_PER_DELTA_ALPHA
-        assert abs(forcing_result.radiative_forcing_w_m2 - expected) < 10.0
+        assert forcing_result.radiative_forcing_w_m2 == pytest.approx(expected, abs=10.0)